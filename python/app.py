@@ -6,24 +6,28 @@ from __future__ import annotations
 import copy
 import json
 import math
+import operator
+import os
+import queue
 import random
-import subprocess
 import sys
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from tkinter import colorchooser, filedialog, messagebox, simpledialog, ttk
 from typing import Any, Callable
 
-from visual_window import VisualLotteryWindow
-from wheel_window import DEFAULT_WHEEL_COLORS, WheelLotteryWindow
+from wheel_window_colors import DEFAULT_WHEEL_COLORS
 
 from lottery import (
-    available_prizes,
+    PrizeConfig,
+    append_csv,
     build_global_must_win,
     draw_prize,
-    load_excluded_people,
-    load_people,
+    fork_state,
     load_prizes,
     load_state,
     parse_people_entries,
@@ -35,19 +39,158 @@ from lottery import (
     remaining_slots,
     resolve_path,
     save_csv,
-    save_state,
     utc_now,
+    write_json,
     write_people_data,
     write_prizes_data,
 )
 
+# Optional config keys; the file's own values win when merged in _load_config.
+_CONFIG_DEFAULTS: dict[str, Any] = {
+    "visual_background_color": "#0b0f1c",
+    "visual_background": "",
+    "visual_music": "",
+    "win_sound": "win.mp3",
+    "visual_screen_x": 0,
+    "visual_screen_y": 0,
+    "visual_screen_width": 0,
+    "visual_screen_height": 0,
+    "excluded_winners_min": 0,
+    "excluded_winners_max": None,
+    "wheel_single_round_display": False,
+    "wheel_round_music": "",
+    "wheel_round_music_volume": 0.6,
+    "wheel_spin_music": "",
+    "wheel_spin_music_volume": 0.6,
+    "wheel_summary_music": "",
+    "wheel_summary_music_volume": 0.6,
+    "wheel_segment_colors": ["#E53935", "#C62828", "#F4C542", "#FF8A65", "#FFD54F"],
+    "wheel_colors": DEFAULT_WHEEL_COLORS,
+}
+
+# Shared file dialog options for participant/prize/excluded data files.
+_DATA_FILE_DIALOG: dict[str, Any] = {"filetypes": [("CSV files", "*.csv"), ("JSON files", "*.json")]}
+
+# (cos, sin) per quantized angle step for the draw-window ball animation.
+_TRIG_TABLE_SIZE = 1024
+_TRIG_TABLE = [
+    (math.cos(2 * math.pi * i / _TRIG_TABLE_SIZE), math.sin(2 * math.pi * i / _TRIG_TABLE_SIZE))
+    for i in range(_TRIG_TABLE_SIZE)
+]
+
+# Treeview iids are row indices; the strings are built once and shared by every tree.
+_ROW_IIDS: list[str] = []
+
+
+def _row_iids(count: int) -> list[str]:
+    """Return the shared iid list, grown to at least ``count`` entries."""
+    if len(_ROW_IIDS) < count:
+        _ROW_IIDS.extend(str(index) for index in range(len(_ROW_IIDS), count))
+    return _ROW_IIDS
+
+
+# Parsed file contents keyed by (loader, path); reused while (mtime_ns, size) is unchanged.
+# Touched from the UI, loader-pool and writer threads, so every access holds the lock.
+# Only the app's own config/data/state files go through it; the oldest entry is dropped past the limit.
+_file_cache: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+_file_cache_lock = threading.Lock()
+_FILE_CACHE_LIMIT = 8
+
+
+def _remember_cached(key: tuple[str, str], entry: tuple[tuple[int, int], Any]) -> None:
+    with _file_cache_lock:
+        _file_cache.pop(key, None)
+        _file_cache[key] = entry
+        while len(_file_cache) > _FILE_CACHE_LIMIT:
+            del _file_cache[next(iter(_file_cache))]
+
+
+def _load_cached(loader: Callable[[Path], Any], path: Path, copier: Callable[[Any], Any] = copy.copy) -> Any:
+    try:
+        stat = path.stat()
+    except OSError:
+        return loader(path)
+    key = (loader.__name__, str(path))
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+    if entry is None or entry[0] != signature:
+        entry = (signature, loader(path))
+        _remember_cached(key, entry)
+    return copier(entry[1])
+
+
+# Visual-window asset bytes (sounds, music, background image) keyed by path;
+# filled off the UI thread and reused while st_mtime_ns is unchanged.
+_asset_cache: dict[str, tuple[int, bytes]] = {}
+_asset_cache_lock = threading.Lock()
+
+
+def _read_asset_bytes(path: Path) -> bytes | None:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(path)
+    with _asset_cache_lock:
+        entry = _asset_cache.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    with _asset_cache_lock:
+        _asset_cache[key] = (mtime_ns, data)
+    return data
+
+
+def _invalidate_cached(path: Path) -> None:
+    target = str(path)
+    with _file_cache_lock:
+        for key in [key for key in _file_cache if key[1] == target]:
+            del _file_cache[key]
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
+def _store_cached(loader: Callable[[Path], Any], path: Path, value: Any) -> None:
+    """Seed the cache with data just written to ``path`` so the next load skips the parse."""
+    _invalidate_cached(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return
+    _remember_cached((loader.__name__, str(path)), ((stat.st_mtime_ns, stat.st_size), value))
+
 
 class LotteryApp:
+    # Editor trees materialize rows in chunks of this size as they scroll.
+    TREE_CHUNK_SIZE = 200
+    # kind -> (data attribute, validator, tree refresh method) for the in-place editors.
+    _DATA_FAMILIES: dict[str, tuple[str, Callable[[Any], Any], str]] = {
+        "people": ("people_data", parse_people_entries, "_refresh_people_tree"),
+        "excluded": ("excluded_data", parse_people_entries, "_refresh_excluded_tree"),
+        "prizes": ("prizes_data", parse_prize_entries, "_refresh_prizes_tree"),
+    }
+    # kind -> (tree attribute, dialog method, noun used in titles and prompts).
+    _EDITOR_UI: dict[str, tuple[str, str, str]] = {
+        "people": ("people_tree", "_open_person_dialog", "人员"),
+        "excluded": ("excluded_tree", "_open_person_dialog", "排除人员"),
+        "prizes": ("prizes_tree", "_open_prize_dialog", "奖项"),
+    }
+
     def __init__(self, root: tk.Tk, config_path: Path) -> None:
         self.root = root
         self.root.title("log-lottery (Python)")
         self.config_path = config_path
         self.base_dir = config_path.parent
+        self._created_output_dir: Path | None = None
 
         self._ensure_default_files()
         self.config = self._load_config()
@@ -59,17 +202,13 @@ class LotteryApp:
         self.output_dir = resolve_path(self.base_dir, self.config.get("output_dir", "output"))
         self.results_file = self.config.get("results_file", "results.json")
         self.results_csv = self.config.get("results_csv", "results.csv")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_output_dir()
         self.state_path = self.output_dir / self.results_file
         self.csv_path = self.output_dir / self.results_csv
 
-        self.people_data = self._load_people_data()
-        self.prizes_data = self._load_prizes_data()
-        self.excluded_data = self._load_excluded_data()
-        self.people = load_people(self.participants_file)
-        self.prizes = load_prizes(self.prizes_file)
-        self.excluded_people = load_excluded_people(self.excluded_file)
-        self.state = load_state(self.state_path)
+        self._load_data_files()
+        self._index_people()
+        self._index_winners()
         self.global_must_win = build_global_must_win(self.prizes)
 
         self.seed_var = tk.StringVar()
@@ -91,52 +230,63 @@ class LotteryApp:
         self.draw_speed = 0.0
         self.draw_angle = 0.0
         self.draw_items: list[dict[str, Any]] = []
+        self._draw_canvas_size = (800, 500)
+        self._winner_popup_items: tuple[int, int] | None = None
+        self._next_frame_due = 0.0
         self.draw_after_id = None
         self.draw_selected_prize_id = None
         self.pending_state: dict[str, Any] | None = None
         self.pending_winners: list[dict[str, Any]] = []
         self.last_space_time = 0.0
+        self._rng = random.Random()
+        self._last_seed = ""
         self.visual_window = None
         # Wheel window is a separate draw experience with multi-stop suspense.
         self.wheel_window = None
+        self._prize_by_id: dict[str, PrizeConfig] = {}
+        self._prize_options: list[str] | None = None
+        self._label_to_id: dict[str, str] = {}
+        self._tree_rows: dict[str, list[tuple[Any, ...]]] = {}
+        self._reload_pending = False
+        self._winners_refresh_pending = False
+        self._winner_lines: list[str] = []
+        self._winner_lines_last: dict[str, Any] | None = None
+        # 各结果 CSV 最近一次写入的中奖列表及写完后的文件大小，仅由写入线程读写
+        self._csv_written: dict[Path, tuple[list[dict[str, Any]], int]] = {}
+        # 结果与名单文件写入放到后台线程，队列中同一目标只保留最新的一次写入
+        self._write_queue: queue.Queue[tuple[tuple[Any, ...], Callable[[], None], str | None] | None] = queue.Queue()
+        # 写入线程不直接调用 Tk，结果经此队列交给界面线程轮询处理
+        self._write_results: queue.Queue[tuple[str, str]] = queue.Queue()
+        self._file_writer = threading.Thread(target=self._run_file_writer, daemon=True)
+        self._file_writer.start()
 
         self._build_ui()
         self._update_login_state()
         self._refresh_prizes()
         self._refresh_winners()
+        self._poll_write_results()
+        threading.Thread(target=self._preload_visual_assets, daemon=True).start()
+
+    def _preload_visual_assets(self) -> None:
+        """Warm the asset cache so opening the visual window does not block on disk reads."""
+        for key in ("win_sound", "visual_music", "visual_background"):
+            asset = self.config.get(key)
+            if asset:
+                _read_asset_bytes(resolve_path(self.base_dir, asset))
 
     def _load_config(self) -> dict:
         if not self.config_path.exists():
             messagebox.showerror("配置错误", f"未找到配置文件: {self.config_path}")
             raise SystemExit(1)
-        config = read_json(self.config_path)
-        config.setdefault("visual_background_color", "#0b0f1c")
-        config.setdefault("visual_background", "")
-        config.setdefault("visual_music", "")
-        config.setdefault("win_sound", "win.mp3")
-        config.setdefault("visual_screen_x", 0)
-        config.setdefault("visual_screen_y", 0)
-        config.setdefault("visual_screen_width", 0)
-        config.setdefault("visual_screen_height", 0)
-        config.setdefault("excluded_winners_min", 0)
-        config.setdefault("excluded_winners_max", None)
-        config.setdefault("wheel_single_round_display", False)
-        config.setdefault("wheel_round_music", "")
-        config.setdefault("wheel_round_music_volume", 0.6)
-        config.setdefault("wheel_spin_music", "")
-        config.setdefault("wheel_spin_music_volume", 0.6)
-        config.setdefault("wheel_summary_music", "")
-        config.setdefault("wheel_summary_music_volume", 0.6)
-        config.setdefault(
-            "wheel_segment_colors",
-            ["#E53935", "#C62828", "#F4C542", "#FF8A65", "#FFD54F"],
-        )
-        config.setdefault("wheel_colors", copy.deepcopy(DEFAULT_WHEEL_COLORS))
+        config = _load_cached(read_json, self.config_path, copy.deepcopy)
+        # 只补齐缺失的键，保留用户配置原有的键顺序
+        for key, value in _CONFIG_DEFAULTS.items():
+            config.setdefault(key, copy.deepcopy(value))
         return config
 
     def _ensure_default_files(self) -> None:
-        self.base_dir.mkdir(parents=True, exist_ok=True)
         if not self.config_path.exists():
+            self.base_dir.mkdir(parents=True, exist_ok=True)
             default_config = {
                 "participants_file": "data/participants.csv",
                 "prizes_file": "data/prizes.csv",
@@ -145,33 +295,20 @@ class LotteryApp:
                 "results_file": "results.json",
                 "results_csv": "results.csv",
                 "admin_password": "admin",
-                "visual_background_color": "#0b0f1c",
-                "visual_background": "",
-                "visual_music": "",
-                "win_sound": "win.mp3",
-                "visual_screen_x": 0,
-                "visual_screen_y": 0,
-                "visual_screen_width": 0,
-                "visual_screen_height": 0,
-                "excluded_winners_min": 0,
-                "excluded_winners_max": None,
-                "wheel_single_round_display": False,
-                "wheel_round_music": "",
-                "wheel_round_music_volume": 0.6,
-                "wheel_spin_music": "",
-                "wheel_spin_music_volume": 0.6,
-                "wheel_summary_music": "",
-                "wheel_summary_music_volume": 0.6,
-                "wheel_segment_colors": ["#E53935", "#C62828", "#F4C542", "#FF8A65", "#FFD54F"],
-                "wheel_colors": copy.deepcopy(DEFAULT_WHEEL_COLORS),
+                **_CONFIG_DEFAULTS,
             }
-            with self.config_path.open("w", encoding="utf-8") as handle:
-                json.dump(default_config, handle, ensure_ascii=False, indent=2)
+            write_json(self.config_path, default_config)
 
         data_dir = self.base_dir / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
+        # One directory listing replaces a stat per default file.
+        try:
+            with os.scandir(data_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            data_dir.mkdir(parents=True, exist_ok=True)
+            present = set()
         participants_path = data_dir / "participants.csv"
-        if not participants_path.exists():
+        if participants_path.name not in present:
             participants = [
                 {"id": "U1001", "name": "张三", "department": "研发"},
                 {"id": "U1002", "name": "李四", "department": "产品"},
@@ -183,11 +320,11 @@ class LotteryApp:
             write_people_data(participants_path, participants)
 
         excluded_path = data_dir / "excluded.csv"
-        if not excluded_path.exists():
+        if excluded_path.name not in present:
             write_people_data(excluded_path, [])
 
         prizes_path = data_dir / "prizes.csv"
-        if not prizes_path.exists():
+        if prizes_path.name not in present:
             prizes = [
                 {
                     "id": "P001",
@@ -219,28 +356,57 @@ class LotteryApp:
             ]
             write_prizes_data(prizes_path, prizes)
 
+    def _ensure_output_dir(self) -> None:
+        if self.output_dir == self._created_output_dir:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._created_output_dir = self.output_dir
+
+    def _load_data_files(self) -> None:
+        """Read the data files and result state concurrently, then parse each list once."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            people_future = pool.submit(self._load_people_data)
+            prizes_future = pool.submit(self._load_prizes_data)
+            excluded_future = pool.submit(self._load_excluded_data)
+            state_future = pool.submit(_load_cached, load_state, self.state_path, copy.deepcopy)
+            self.people_data = people_future.result()
+            self.prizes_data = prizes_future.result()
+            self.excluded_data = excluded_future.result()
+            self.state = state_future.result()
+        self.people = parse_people_entries(self.people_data)
+        self.prizes = parse_prize_entries(self.prizes_data)
+        self.excluded_people = parse_people_entries(self.excluded_data)
+        self._excluded_ids = frozenset(person.person_id for person in self.excluded_people)
+
     def _load_people_data(self) -> list[dict[str, Any]]:
         try:
-            data = read_people_data(self.participants_file)
+            data = _load_cached(read_people_data, self.participants_file)
         except FileNotFoundError:
             return []
         return data
 
     def _load_prizes_data(self) -> list[dict[str, Any]]:
         try:
-            data = read_prizes_data(self.prizes_file)
+            data = _load_cached(read_prizes_data, self.prizes_file)
         except FileNotFoundError:
             return []
         return data
 
     def _load_excluded_data(self) -> list[dict[str, Any]]:
         try:
-            data = read_excluded_data(self.excluded_file)
+            data = _load_cached(read_excluded_data, self.excluded_file)
         except FileNotFoundError:
             return []
         return data
 
     def _build_ui(self) -> None:
+        # 状态栏先于 Notebook 打包到底部，保存提示在此显示几秒后自动清除
+        self.status_var = tk.StringVar()
+        self._status_after_id: str | None = None
+        ttk.Label(self.root, textvariable=self.status_var, anchor=tk.W, padding=(10, 2)).pack(
+            side=tk.BOTTOM, fill=tk.X
+        )
+
         self.main_notebook = ttk.Notebook(self.root)
         self.main_notebook.pack(fill=tk.BOTH, expand=True)
 
@@ -256,11 +422,36 @@ class LotteryApp:
         self.main_notebook.add(self.prizes_tab, text="奖项配置")
         self.main_notebook.add(self.excluded_tab, text="排除名单")
 
+        # Editor tabs are built the first time they are selected.
+        self._tab_builders: dict[str, Callable[[ttk.Frame], None]] = {
+            str(self.config_tab): self._build_config_editor,
+            str(self.participants_tab): self._build_people_editor,
+            str(self.prizes_tab): self._build_prizes_editor,
+            str(self.excluded_tab): self._build_excluded_editor,
+        }
+        self._tab_changed_binding = self.main_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         self._build_main_tab()
-        self._build_config_editor(self.config_tab)
-        self._build_people_editor(self.participants_tab)
-        self._build_prizes_editor(self.prizes_tab)
-        self._build_excluded_editor(self.excluded_tab)
+
+    def _flash_status(self, text: str, duration_ms: int = 3000) -> None:
+        """Show a transient status message without blocking the event loop."""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+        self.status_var.set(text)
+        self._status_after_id = self.root.after(duration_ms, self._clear_status)
+
+    def _clear_status(self) -> None:
+        self._status_after_id = None
+        self.status_var.set("")
+
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        tab_name = self.main_notebook.select()
+        builder = self._tab_builders.pop(tab_name, None)
+        if builder is not None:
+            builder(self.main_notebook.nametowidget(tab_name))
+        if not self._tab_builders:
+            # 所有页签都已构建，之后切换页签无需再回调
+            self.main_notebook.unbind("<<NotebookTabChanged>>", self._tab_changed_binding)
 
     def _build_main_tab(self) -> None:
         header_frame = ttk.Frame(self.main_frame, padding=10)
@@ -287,21 +478,34 @@ class LotteryApp:
 
         action_frame = ttk.Frame(self.main_frame, padding=10)
         action_frame.pack(fill=tk.X)
-        ttk.Button(action_frame, text="抽取当前奖项", command=self._draw_selected).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="抽取全部奖项", command=self._draw_all).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="打开抽奖界面", command=self._open_draw_window).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="转盘抽奖", command=self._open_wheel_window).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="转盘设置", command=self._open_wheel_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="开启大屏模式", command=self._open_visual_window).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="大屏设置", command=self._open_visual_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="刷新名单", command=self._refresh_winners).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="重置结果", command=self._reset_results).pack(side=tk.LEFT, padx=5)
+        self._pack_buttons(
+            action_frame,
+            (
+                ("抽取当前奖项", self._draw_selected),
+                ("抽取全部奖项", self._draw_all),
+                ("打开抽奖界面", self._open_draw_window),
+                ("转盘抽奖", self._open_wheel_window),
+                ("转盘设置", self._open_wheel_settings),
+                ("开启大屏模式", self._open_visual_window),
+                ("大屏设置", self._open_visual_settings),
+                ("刷新名单", self._refresh_winners),
+                ("重置结果", self._reset_results),
+            ),
+        )
 
         output_frame = ttk.LabelFrame(self.main_frame, text="中奖名单", padding=10)
         output_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        self.output_text = tk.Text(output_frame, height=16, wrap=tk.WORD)
+        # 中奖记录每条一行，不折行：Text 无需为每行计算换行布局，长名单刷新更快
+        output_xscroll = ttk.Scrollbar(output_frame, orient=tk.HORIZONTAL)
+        self.output_text = tk.Text(output_frame, height=16, wrap=tk.NONE, xscrollcommand=output_xscroll.set)
+        output_xscroll.configure(command=self.output_text.xview)
+        output_xscroll.pack(side=tk.BOTTOM, fill=tk.X)
         self.output_text.pack(fill=tk.BOTH, expand=True)
 
+    def _pack_buttons(self, parent: ttk.Frame, specs: tuple[tuple[str, Callable[[], None]], ...]) -> None:
+        for text, command in specs:
+            ttk.Button(parent, text=text, command=command).pack(side=tk.LEFT, padx=5)
+
     def _build_config_editor(self, parent: ttk.Frame) -> None:
         info_frame = ttk.Frame(parent, padding=10)
         info_frame.pack(fill=tk.X)
@@ -324,17 +528,21 @@ class LotteryApp:
 
         button_frame = ttk.Frame(parent, padding=10)
         button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="选择配置文件", command=self._select_config_file).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="选择人员名单", command=self._select_participants_file).pack(
-            side=tk.LEFT, padx=5
+        self._pack_buttons(
+            button_frame,
+            (
+                ("选择配置文件", self._select_config_file),
+                ("选择人员名单", self._select_participants_file),
+                ("选择奖项配置", self._select_prizes_file),
+                ("选择输出目录", self._select_output_dir),
+                ("登录/退出", self._toggle_login),
+                ("重新加载配置", self._reload_all),
+            ),
         )
-        ttk.Button(button_frame, text="选择奖项配置", command=self._select_prizes_file).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="选择输出目录", command=self._select_output_dir).pack(side=tk.LEFT, padx=5)
+        # 排除名单按钮仅登录后显示，由 _update_config_visibility 负责打包
         self.excluded_select_button = ttk.Button(
             button_frame, text="选择排除名单", command=self._select_excluded_file
         )
-        ttk.Button(button_frame, text="登录/退出", command=self._toggle_login).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="重新加载配置", command=self._reload_all).pack(side=tk.LEFT, padx=5)
         self._update_config_visibility()
 
     def _build_people_editor(self, parent: ttk.Frame) -> None:
@@ -346,19 +554,25 @@ class LotteryApp:
         ):
             self.people_tree.heading(col, text=label)
             self.people_tree.column(col, width=width, anchor=tk.W)
+        self.people_tree.configure(yscrollcommand=lambda first, last: self._on_tree_scroll(self.people_tree, last))
         self.people_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self._refresh_people_tree()
 
         button_frame = ttk.Frame(parent, padding=10)
         button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="新增", command=self._add_person).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="修改", command=self._edit_person).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="删除", command=self._delete_person).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="上移", command=self._move_person_up).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="下移", command=self._move_person_down).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导入", command=self._import_people).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导出", command=self._export_people).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="保存", command=self._save_people).pack(side=tk.LEFT, padx=5)
+        self._pack_buttons(
+            button_frame,
+            (
+                ("新增", partial(self._add_entry, "people")),
+                ("修改", partial(self._edit_entry, "people")),
+                ("删除", partial(self._delete_entry, "people")),
+                ("上移", partial(self._move_entry, "people", -1)),
+                ("下移", partial(self._move_entry, "people", 1)),
+                ("导入", self._import_people),
+                ("导出", self._export_people),
+                ("保存", self._save_people),
+            ),
+        )
 
     def _build_prizes_editor(self, parent: ttk.Frame) -> None:
         self.prize_columns_basic = ("id", "name", "count", "spin_speed_ratio", "exclude_previous_winners")
@@ -372,48 +586,53 @@ class LotteryApp:
             "exclude_excluded_list",
             "must_win_ids",
         )
-        self.prizes_tree = ttk.Treeview(
-            parent,
-            columns=(
-                "id",
-                "name",
-                "count",
-                "spin_speed_ratio",
-                "exclude_previous_winners",
-                "exclude_must_win",
-                "exclude_excluded_list",
-                "must_win_ids",
-            ),
-            show="headings",
-            height=12,
-        )
-        headings = (
-            ("id", "奖项ID", 90),
-            ("name", "奖项名称", 120),
-            ("count", "数量", 60),
-            ("spin_speed_ratio", "转盘速度倍速", 110),
-            ("exclude_previous_winners", "排除已中奖", 90),
-            ("exclude_must_win", "排除保底", 90),
-            ("exclude_excluded_list", "应用排除名单", 110),
-            ("must_win_ids", "保底工号", 160),
-        )
-        for col, label, width in headings:
-            self.prizes_tree.heading(col, text=label)
-            self.prizes_tree.column(col, width=width, anchor=tk.W)
-        self.prizes_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        headings = {
+            "id": ("奖项ID", 90),
+            "name": ("奖项名称", 120),
+            "count": ("数量", 60),
+            "spin_speed_ratio": ("转盘速度倍速", 110),
+            "exclude_previous_winners": ("排除已中奖", 90),
+            "exclude_must_win": ("排除保底", 90),
+            "exclude_excluded_list": ("应用排除名单", 110),
+            "must_win_ids": ("保底工号", 160),
+        }
+        # 普通/管理员两套表格各建一次，登录切换时只 pack/pack_forget，避免整表重排
+        tree_frame = ttk.Frame(parent)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.prizes_tree_basic = self._build_prize_tree(tree_frame, self.prize_columns_basic, headings)
+        self.prizes_tree_admin = self._build_prize_tree(tree_frame, self.prize_columns_admin, headings)
+        self.prizes_tree = self.prizes_tree_basic
+        self._prize_rows: list[tuple[Any, ...]] = []
+        self._stale_prize_trees: set[str] = set()
         self._update_prize_columns()
         self._refresh_prizes_tree()
 
         button_frame = ttk.Frame(parent, padding=10)
         button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="新增", command=self._add_prize).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="修改", command=self._edit_prize).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="删除", command=self._delete_prize).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="上移", command=self._move_prize_up).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="下移", command=self._move_prize_down).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导入", command=self._import_prizes).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导出", command=self._export_prizes).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="保存", command=self._save_prizes).pack(side=tk.LEFT, padx=5)
+        self._pack_buttons(
+            button_frame,
+            (
+                ("新增", partial(self._add_entry, "prizes")),
+                ("修改", partial(self._edit_entry, "prizes")),
+                ("删除", partial(self._delete_entry, "prizes")),
+                ("上移", partial(self._move_entry, "prizes", -1)),
+                ("下移", partial(self._move_entry, "prizes", 1)),
+                ("导入", self._import_prizes),
+                ("导出", self._export_prizes),
+                ("保存", self._save_prizes),
+            ),
+        )
+
+    def _build_prize_tree(
+        self, parent: ttk.Frame, columns: tuple[str, ...], headings: dict[str, tuple[str, int]]
+    ) -> ttk.Treeview:
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=12)
+        for col in columns:
+            label, width = headings[col]
+            tree.heading(col, text=label)
+            tree.column(col, width=width, anchor=tk.W)
+        tree.configure(yscrollcommand=lambda first, last: self._on_tree_scroll(tree, last))
+        return tree
 
     def _build_excluded_editor(self, parent: ttk.Frame) -> None:
         self.excluded_admin_frame = ttk.Frame(parent)
@@ -449,19 +668,27 @@ class LotteryApp:
         ):
             self.excluded_tree.heading(col, text=label)
             self.excluded_tree.column(col, width=width, anchor=tk.W)
+        self.excluded_tree.configure(
+            yscrollcommand=lambda first, last: self._on_tree_scroll(self.excluded_tree, last)
+        )
         self.excluded_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self._refresh_excluded_tree()
 
         button_frame = ttk.Frame(self.excluded_admin_frame, padding=10)
         button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="新增", command=self._add_excluded).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="修改", command=self._edit_excluded).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="删除", command=self._delete_excluded).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="上移", command=self._move_excluded_up).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="下移", command=self._move_excluded_down).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导入", command=self._import_excluded).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="导出", command=self._export_excluded).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="保存", command=self._save_excluded).pack(side=tk.LEFT, padx=5)
+        self._pack_buttons(
+            button_frame,
+            (
+                ("新增", partial(self._add_entry, "excluded")),
+                ("修改", partial(self._edit_entry, "excluded")),
+                ("删除", partial(self._delete_entry, "excluded")),
+                ("上移", partial(self._move_entry, "excluded", -1)),
+                ("下移", partial(self._move_entry, "excluded", 1)),
+                ("导入", self._import_excluded),
+                ("导出", self._export_excluded),
+                ("保存", self._save_excluded),
+            ),
+        )
         self._update_excluded_visibility()
 
     def _select_config_file(self) -> None:
@@ -471,7 +698,7 @@ class LotteryApp:
         self.config_path = Path(path)
         self.base_dir = self.config_path.parent
         self.config_path_var.set(str(self.config_path))
-        self._reload_all()
+        self._schedule_reload()
 
     def _relative_or_absolute(self, path: Path) -> str:
         try:
@@ -480,41 +707,26 @@ class LotteryApp:
             return str(path)
 
     def _save_config_file(self) -> None:
-        with self.config_path.open("w", encoding="utf-8") as handle:
-            json.dump(self.config, handle, ensure_ascii=False, indent=2)
+        write_json(self.config_path, self.config)
+        # 紧随其后的 _reload_all 直接复用刚写入的配置，不必重读解析 config.json
+        _store_cached(read_json, self.config_path, copy.deepcopy(self.config))
 
-    def _select_participants_file(self) -> None:
-        path = filedialog.askopenfilename(
-            title="选择人员名单文件",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
-        )
+    def _select_data_file(self, config_key: str, title: str) -> None:
+        path = filedialog.askopenfilename(title=title, **_DATA_FILE_DIALOG)
         if not path:
             return
-        self.config["participants_file"] = self._relative_or_absolute(Path(path))
+        self.config[config_key] = self._relative_or_absolute(Path(path))
         self._save_config_file()
-        self._reload_all()
+        self._schedule_reload()
+
+    def _select_participants_file(self) -> None:
+        self._select_data_file("participants_file", "选择人员名单文件")
 
     def _select_prizes_file(self) -> None:
-        path = filedialog.askopenfilename(
-            title="选择奖项配置文件",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
-        )
-        if not path:
-            return
-        self.config["prizes_file"] = self._relative_or_absolute(Path(path))
-        self._save_config_file()
-        self._reload_all()
+        self._select_data_file("prizes_file", "选择奖项配置文件")
 
     def _select_excluded_file(self) -> None:
-        path = filedialog.askopenfilename(
-            title="选择排除名单文件",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
-        )
-        if not path:
-            return
-        self.config["excluded_file"] = self._relative_or_absolute(Path(path))
-        self._save_config_file()
-        self._reload_all()
+        self._select_data_file("excluded_file", "选择排除名单文件")
 
     def _select_output_dir(self) -> None:
         path = filedialog.askdirectory(title="选择输出目录")
@@ -522,6 +734,17 @@ class LotteryApp:
             return
         self.config["output_dir"] = self._relative_or_absolute(Path(path))
         self._save_config_file()
+        self._schedule_reload()
+
+    def _schedule_reload(self) -> None:
+        """Coalesce back-to-back path changes into a single ``_reload_all`` at idle time."""
+        if self._reload_pending:
+            return
+        self._reload_pending = True
+        self.root.after_idle(self._run_scheduled_reload)
+
+    def _run_scheduled_reload(self) -> None:
+        self._reload_pending = False
         self._reload_all()
 
     def _toggle_login(self) -> None:
@@ -544,21 +767,29 @@ class LotteryApp:
     def _update_login_state(self) -> None:
         self.login_status_var.set("已登录" if self.is_admin else "未登录")
         self._update_prize_columns()
-        self._refresh_prizes_tree()
         self._update_config_visibility()
         self._update_excluded_visibility()
 
     def _update_prize_columns(self) -> None:
         if not hasattr(self, "prizes_tree"):
             return
-        display = self.prize_columns_admin if self.is_admin else self.prize_columns_basic
-        self.prizes_tree["displaycolumns"] = display
+        active, hidden = (
+            (self.prizes_tree_admin, self.prizes_tree_basic)
+            if self.is_admin
+            else (self.prizes_tree_basic, self.prizes_tree_admin)
+        )
+        hidden.pack_forget()
+        active.pack(fill=tk.BOTH, expand=True)
+        self.prizes_tree = active
+        if str(active) in self._stale_prize_trees:
+            self._stale_prize_trees.discard(str(active))
+            self._populate_tree(active, [row[: len(active["columns"])] for row in self._prize_rows])
 
     def _update_excluded_visibility(self) -> None:
-        if not hasattr(self, "excluded_admin_frame"):
-            return
         if hasattr(self, "main_notebook") and hasattr(self, "excluded_tab"):
             self.main_notebook.tab(self.excluded_tab, state="normal" if self.is_admin else "hidden")
+        if not hasattr(self, "excluded_admin_frame"):
+            return
         if self.is_admin:
             self.excluded_admin_frame.pack(fill=tk.BOTH, expand=True)
         else:
@@ -610,6 +841,8 @@ class LotteryApp:
 
         self.draw_canvas = tk.Canvas(center_panel, bg="#1f2230", highlightthickness=0)
         self.draw_canvas.pack(fill=tk.BOTH, expand=True)
+        self.draw_canvas.bind("<Configure>", self._on_draw_canvas_configure)
+        self._winner_popup_items = None
 
         right_panel = ttk.Frame(container, width=260)
         right_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=10, pady=10)
@@ -626,6 +859,17 @@ class LotteryApp:
 
         self._build_idle_grid()
 
+    def _on_draw_canvas_configure(self, event: tk.Event) -> None:
+        self._draw_canvas_size = (event.width, event.height)
+
+    def _measure_draw_canvas(self) -> tuple[int, int]:
+        """Read the real canvas size once (after pending layout) and seed the <Configure> cache."""
+        self.draw_canvas.update_idletasks()
+        width = self.draw_canvas.winfo_width()
+        height = self.draw_canvas.winfo_height()
+        self._draw_canvas_size = (width if width > 1 else 800, height if height > 1 else 500)
+        return self._draw_canvas_size
+
     def _close_draw_window(self) -> None:
         if self.draw_after_id and self.draw_canvas:
             self.draw_canvas.after_cancel(self.draw_after_id)
@@ -641,23 +885,22 @@ class LotteryApp:
             self.wheel_window.lift()
             return
 
-        # 2. 准备数据：确保所有必要的变量都已存在
-        # 如果 self.excluded_ids 不存在，则从加载函数获取
-        excluded_ids = getattr(self, "excluded_ids", None)
-        if excluded_ids is None:
-            # 尝试重新加载一次全局排除名单
-            excluded_ids = load_excluded_people(resolve_path(self.base_dir, self.config["excluded_file"]))
-        
-        # 重新同步一次最新的状态和奖项
-        self.prizes = load_prizes(resolve_path(self.base_dir, self.config["prizes_file"]))
-        self.state = load_state(resolve_path(self.base_dir, self.config["output_dir"]) / self.config["results_file"])
-        global_must_win = build_global_must_win(self.prizes)
+        # 2. 准备数据：排除名单直接复用已加载的工号集合
+        excluded_ids = self._current_excluded_ids()
 
-        # 3. 获取主界面当前选中的奖项ID
-        current_prize_id = None
-        current_val = self.prize_combo.get()
-        if current_val:
-             current_prize_id = current_val.split(" - ")[0]
+        # 获取主界面当前选中的奖项ID（需在重新加载前解析标签）
+        current_prize_id = self._label_to_id.get(self.prize_combo.get())
+
+        # 重新同步一次最新的状态和奖项（先等待后台写入完成，避免读到旧文件）
+        self._flush_writes()
+        prizes = _load_cached(load_prizes, self.prizes_file)
+        if prizes != self.prizes:
+            # 奖项文件有变化时才重建保底集合，并同步到主界面后续的抽奖
+            self.prizes = prizes
+            self.global_must_win = build_global_must_win(prizes)
+        self.state = _load_cached(load_state, self.state_path, copy.deepcopy)
+        self._index_prizes()
+        self._index_winners()
 
         # 4. 创建转盘窗口
         include_excluded = self._include_excluded_list()
@@ -672,13 +915,16 @@ class LotteryApp:
         wheel_summary_volume = float(self.config.get("wheel_summary_music_volume", 0.6) or 0.6)
         wheel_segment_colors = self.config.get("wheel_segment_colors")
 
+        # Imported on demand so pygame is only loaded once a draw window is opened.
+        from wheel_window import WheelLotteryWindow
+
         self.wheel_window = WheelLotteryWindow(
             root=self.root,
             base_dir=self.base_dir,
             prizes=self.prizes,
             people=self.people,
             state=self.state,
-            global_must_win=global_must_win,
+            global_must_win=self.global_must_win,
             excluded_ids=excluded_ids,
             include_excluded=include_excluded,
             excluded_winner_range=excluded_range,
@@ -748,10 +994,9 @@ class LotteryApp:
     def _on_prize_selected(self, event: tk.Event) -> None:
         """Handle prize selection in the main dropdown."""
         # 原有的逻辑保持不变...
-        val = self.prize_combo.get()
-        if not val:
+        prize_id = self._label_to_id.get(self.prize_combo.get())
+        if not prize_id:
             return
-        prize_id = val.split(" - ")[0]
         
         # 新增逻辑：如果转盘窗口开着，通知它切换奖项
         if hasattr(self, "wheel_window") and self.wheel_window and self.wheel_window.winfo_exists():
@@ -795,10 +1040,7 @@ class LotteryApp:
         spin_volume_var = tk.DoubleVar(value=float(self.config.get("wheel_spin_music_volume", 0.6) or 0.6))
         summary_music_var = tk.StringVar(value=str(self.config.get("wheel_summary_music", "")))
         summary_volume_var = tk.DoubleVar(value=float(self.config.get("wheel_summary_music_volume", 0.6) or 0.6))
-        segment_colors = self.config.get(
-            "wheel_segment_colors",
-            ["#E53935", "#C62828", "#F4C542", "#FF8A65", "#FFD54F"],
-        )
+        segment_colors = self.config.get("wheel_segment_colors", _CONFIG_DEFAULTS["wheel_segment_colors"])
         segment_color_vars = [
             tk.StringVar(value=segment_colors[i] if i < len(segment_colors) else "#E53935")
             for i in range(5)
@@ -962,14 +1204,13 @@ class LotteryApp:
         prize = None
         selected_label = self.prize_var.get().strip()
         if selected_label:
-            prize_id = selected_label.split(" - ", 1)[0]
-            prize = next((item for item in self.prizes if item.prize_id == prize_id), None)
+            prize = self._prize_by_id.get(self._label_to_id.get(selected_label, ""))
         if not prize:
-            available = available_prizes(self.prizes, self.state)
-            if not available:
+            # _refresh_prizes 已按顺序收录了仍有名额的奖项，取第一个即可，无需再逐项计算剩余名额
+            prize = next((self._prize_by_id[prize_id] for prize_id in self._label_to_id.values()), None)
+            if not prize:
                 messagebox.showwarning("提示", "当前没有可抽奖项。")
                 return
-            prize = available[0]
         excluded_ids = self._current_excluded_ids()
         include_excluded = self._include_excluded_list()
         excluded_range = self._get_excluded_winner_range()
@@ -977,12 +1218,19 @@ class LotteryApp:
         background_path = self.config.get("visual_background") or None
         background_music_path = self.config.get("visual_music") or None
         win_sound_path = self.config.get("win_sound", "win.mp3") or None
+        win_sound_data = _read_asset_bytes(resolve_path(self.base_dir, win_sound_path)) if win_sound_path else None
+        background_data = _read_asset_bytes(resolve_path(self.base_dir, background_path)) if background_path else None
+        background_music_data = (
+            _read_asset_bytes(resolve_path(self.base_dir, background_music_path)) if background_music_path else None
+        )
         screen_geometry = {
             "x": int(self.config.get("visual_screen_x", 0) or 0),
             "y": int(self.config.get("visual_screen_y", 0) or 0),
             "width": int(self.config.get("visual_screen_width", 0) or 0),
             "height": int(self.config.get("visual_screen_height", 0) or 0),
         }
+        from visual_window import VisualLotteryWindow
+
         self.visual_window = VisualLotteryWindow(
             self.root,
             self.base_dir,
@@ -1001,6 +1249,9 @@ class LotteryApp:
             screen_geometry,
             self._on_visual_complete,
             self._on_visual_closed,
+            win_sound_data=win_sound_data,
+            background_data=background_data,
+            background_music_data=background_music_data,
         )
 
     def _on_visual_complete(self, winners: list[dict[str, Any]]) -> None:
@@ -1115,10 +1366,11 @@ class LotteryApp:
 
         dialog.wait_window()
 
-    def _handle_space(self, event: tk.Event) -> None:
+    def _handle_space(self, event: tk.Event) -> str | None:
+        # Key auto-repeat fires many events per second; drop them before touching any draw state.
         current = time.monotonic()
         if current - self.last_space_time < 1.0:
-            return
+            return "break"
         self.last_space_time = current
         if self.draw_phase == "idle":
             self._enter_draw()
@@ -1128,6 +1380,7 @@ class LotteryApp:
             self._draw_lucky()
         elif self.draw_phase == "drawn":
             self._transfer_draw()
+        return None
 
     def _refresh_draw_prize_list(self) -> None:
         if not hasattr(self, "draw_prize_list"):
@@ -1152,10 +1405,11 @@ class LotteryApp:
     def _build_idle_grid(self) -> None:
         if not self.draw_canvas:
             return
-        self.draw_canvas.delete("all")
-        names = [person.name for person in self.people if person.person_id not in {w['person_id'] for w in self.state["winners"]}]
+        self.draw_canvas.delete("draw_items")
+        winner_ids = self._winner_ids
+        names = [person.name for person in self.people if person.person_id not in winner_ids]
         if not names:
-            names = [person.name for person in self.people]
+            names = self._all_names
         if not names:
             names = ["暂无人员"]
         count = max(40, len(names))
@@ -1170,8 +1424,7 @@ class LotteryApp:
         else:
             font_size = 12
         pool = [names[i % len(names)] for i in range(count)]
-        width = self.draw_canvas.winfo_width() or 800
-        height = self.draw_canvas.winfo_height() or 500
+        width, height = self._measure_draw_canvas()
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) * 0.35
@@ -1188,42 +1441,78 @@ class LotteryApp:
                 fill="#ffd1e8",
                 font=("Helvetica", font_size, "bold"),
                 angle=angle_deg,
+                tags="draw_items",
             )
-            self.draw_items.append({"id": item_id, "angle": angle, "radius": radius})
+            self.draw_items.append({"id": item_id, "angle": angle, "radius": radius, "x": x, "y": y})
 
     def _animate_idle_grid(self) -> None:
         if not self.draw_canvas or self.draw_phase != "idle":
             return
-        width = self.draw_canvas.winfo_width()
-        height = self.draw_canvas.winfo_height()
+        width, height = self._draw_canvas_size
+        # 位置在 Python 侧维护，不再逐项 move + coords 回读
+        positions = []
         for item in self.draw_items:
-            self.draw_canvas.move(item["id"], item["vx"], item["vy"])
-            x, y = self.draw_canvas.coords(item["id"])
+            x = item["x"] + item["vx"]
+            y = item["y"] + item["vy"]
             if x < 20 or x > width - 20:
                 item["vx"] *= -1
             if y < 20 or y > height - 20:
                 item["vy"] *= -1
-        self.draw_after_id = self.draw_canvas.after(50, self._animate_idle_grid)
+            item["x"] = x
+            item["y"] = y
+            positions.append((item["id"], x, y))
+        now = time.monotonic()
+        if not self._frame_behind(now, 0.05):
+            self._set_draw_coords(positions)
+        self.draw_after_id = self.draw_canvas.after(self._next_frame_delay(now, 0.05), self._animate_idle_grid)
+
+    def _set_draw_coords(self, positions: list[tuple[int, float, float]]) -> None:
+        """Move many draw-canvas items with a single Tcl evaluation."""
+        if not positions:
+            return
+        path = str(self.draw_canvas)
+        self.draw_canvas.tk.eval("\n".join(f"{path} coords {item_id} {x:.1f} {y:.1f}" for item_id, x, y in positions))
+
+    def _restart_draw_animation(self, step: Callable[[], None]) -> None:
+        """Run ``step`` as the only draw-canvas timer, cancelling any loop already scheduled."""
+        if self.draw_after_id and self.draw_canvas:
+            self.draw_canvas.after_cancel(self.draw_after_id)
+        self.draw_after_id = None
+        self._next_frame_due = time.monotonic()
+        step()
+
+    def _frame_behind(self, now: float, interval: float) -> bool:
+        """True when this tick is more than one frame late and its redraw should be dropped."""
+        return now > self._next_frame_due + interval
+
+    def _next_frame_delay(self, now: float, interval: float) -> int:
+        """Advance the frame deadline and return the ``after`` delay (ms) that keeps a fixed cadence."""
+        self._next_frame_due += interval
+        if self._next_frame_due < now - interval:
+            # 长时间卡顿后重新对齐，避免连续补帧
+            self._next_frame_due = now
+        return max(1, int((self._next_frame_due - now) * 1000))
 
     def _enter_draw(self) -> None:
         if not self.draw_canvas:
             return
         if not self.draw_selected_prize_id and self.prizes:
             self.draw_selected_prize_id = self.prizes[0].prize_id
-        self.draw_canvas.delete("all")
+        self._hide_winner_popup()
         self.draw_phase = "entered"
         self.draw_speed = 0.01
         self.draw_angle = 0.0
         self._build_ball()
-        self._animate_ball()
+        self._restart_draw_animation(self._animate_ball)
 
     def _build_ball(self) -> None:
         if not self.draw_canvas:
             return
-        self.draw_canvas.delete("all")
-        names = [person.name for person in self.people if person.person_id not in {w['person_id'] for w in self.state["winners"]}]
+        self.draw_canvas.delete("draw_items")
+        winner_ids = self._winner_ids
+        names = [person.name for person in self.people if person.person_id not in winner_ids]
         if not names:
-            names = [person.name for person in self.people]
+            names = self._all_names
         if not names:
             names = ["暂无人员"]
         count = max(40, len(names))
@@ -1238,8 +1527,7 @@ class LotteryApp:
         else:
             font_size = 12
         pool = [names[i % len(names)] for i in range(count)]
-        width = self.draw_canvas.winfo_width() or 800
-        height = self.draw_canvas.winfo_height() or 500
+        width, height = self._measure_draw_canvas()
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) * 0.35
@@ -1256,30 +1544,41 @@ class LotteryApp:
                 fill="#ffd1e8",
                 font=("Helvetica", font_size, "bold"),
                 angle=angle_deg,
+                tags="draw_items",
+            )
+            self.draw_items.append(
+                {"id": item_id, "base_idx": idx * _TRIG_TABLE_SIZE // count, "radius": radius}
             )
-            self.draw_items.append({"id": item_id, "angle": angle, "radius": radius})
 
     def _animate_ball(self) -> None:
         if not self.draw_canvas or self.draw_phase not in {"entered", "spinning"}:
             return
-        width = self.draw_canvas.winfo_width()
-        height = self.draw_canvas.winfo_height()
+        now = time.monotonic()
+        self.draw_angle += self.draw_speed
+        if self._frame_behind(now, 0.04):
+            self.draw_after_id = self.draw_canvas.after(self._next_frame_delay(now, 0.04), self._animate_ball)
+            return
+        width, height = self._draw_canvas_size
         center_x = width / 2
         center_y = height / 2
-        self.draw_angle += self.draw_speed
+        # 角度量化为查表下标，避免每帧每项调用 cos/sin
+        offset = int(self.draw_angle * _TRIG_TABLE_SIZE / (2 * math.pi))
+        mask = _TRIG_TABLE_SIZE - 1
+        table = _TRIG_TABLE
+        positions = []
         for item in self.draw_items:
-            angle = item["angle"] + self.draw_angle
-            x = center_x + item["radius"] * math.cos(angle)
-            y = center_y + item["radius"] * math.sin(angle)
-            self.draw_canvas.coords(item["id"], x, y)
-        self.draw_after_id = self.draw_canvas.after(40, self._animate_ball)
+            cos_a, sin_a = table[(item["base_idx"] + offset) & mask]
+            radius = item["radius"]
+            positions.append((item["id"], center_x + radius * cos_a, center_y + radius * sin_a))
+        self._set_draw_coords(positions)
+        self.draw_after_id = self.draw_canvas.after(self._next_frame_delay(now, 0.04), self._animate_ball)
 
     def _start_spin(self) -> None:
         if self.draw_phase not in {"entered", "idle"}:
             return
         self.draw_phase = "spinning"
         self.draw_speed = 0.2
-        self._animate_ball()
+        self._restart_draw_animation(self._animate_ball)
 
     def _draw_lucky(self) -> None:
         if self.draw_phase != "spinning":
@@ -1288,14 +1587,14 @@ class LotteryApp:
         if not self.draw_selected_prize_id:
             messagebox.showwarning("提示", "请先选择奖项。")
             return
-        prize = next((item for item in self.prizes if item.prize_id == self.draw_selected_prize_id), None)
+        prize = self._prize_by_id.get(self.draw_selected_prize_id)
         if not prize:
             messagebox.showerror("错误", "奖项不存在。")
             return
         excluded_ids = self._current_excluded_ids()
         include_excluded = self._include_excluded_list()
         excluded_range = self._get_excluded_winner_range()
-        preview_state = copy.deepcopy(self.state)
+        preview_state = fork_state(self.state, prize.prize_id)
         try:
             self.pending_winners = draw_prize(
                 prize,
@@ -1306,6 +1605,7 @@ class LotteryApp:
                 include_excluded=include_excluded,
                 excluded_winner_range=excluded_range,
                 prizes=self.prizes,
+                rng=self._rng,
             )
         except ValueError as exc:
             messagebox.showerror("抽奖失败", str(exc))
@@ -1320,27 +1620,27 @@ class LotteryApp:
     def _show_winner_popup(self, names: str) -> None:
         if not self.draw_canvas:
             return
-        width = self.draw_canvas.winfo_width()
-        height = self.draw_canvas.winfo_height()
-        self.draw_canvas.delete("winner_popup")
-        self.draw_canvas.create_rectangle(
-            width * 0.3,
-            height * 0.35,
-            width * 0.7,
-            height * 0.65,
-            fill="#f7d6e5",
-            outline="#ffffff",
-            width=2,
-            tags="winner_popup",
-        )
-        self.draw_canvas.create_text(
-            width / 2,
-            height / 2,
-            text=names,
-            fill="#2f1f33",
-            font=("Helvetica", 14, "bold"),
-            tags="winner_popup",
-        )
+        width, height = self._draw_canvas_size
+        canvas = self.draw_canvas
+        if self._winner_popup_items is None:
+            # 弹窗矩形和文字只创建一次，之后仅更新坐标/文字并切换显示状态
+            rect_id = canvas.create_rectangle(
+                0, 0, 0, 0, fill="#f7d6e5", outline="#ffffff", width=2, tags="winner_popup"
+            )
+            text_id = canvas.create_text(
+                0, 0, fill="#2f1f33", font=("Helvetica", 14, "bold"), tags="winner_popup"
+            )
+            self._winner_popup_items = (rect_id, text_id)
+        rect_id, text_id = self._winner_popup_items
+        canvas.coords(rect_id, width * 0.3, height * 0.35, width * 0.7, height * 0.65)
+        canvas.coords(text_id, width / 2, height / 2)
+        canvas.itemconfigure(text_id, text=names)
+        canvas.itemconfigure("winner_popup", state="normal")
+        canvas.tag_raise("winner_popup")
+
+    def _hide_winner_popup(self) -> None:
+        if self.draw_canvas and self._winner_popup_items is not None:
+            self.draw_canvas.itemconfigure("winner_popup", state="hidden")
 
     def _transfer_draw(self) -> None:
         if not self.pending_state or not self.pending_winners:
@@ -1356,20 +1656,34 @@ class LotteryApp:
         messagebox.showinfo("完成", "本次抽奖已转存。")
 
     def _set_seed(self) -> None:
+        # 仅在种子输入变化时重建随机数生成器，连续抽奖沿用同一随机序列
         seed = self.seed_var.get().strip()
-        if seed:
-            try:
-                random.seed(int(seed))
-            except ValueError:
-                messagebox.showerror("种子错误", "随机种子必须是整数。")
-                raise
+        if seed == self._last_seed:
+            return
+        try:
+            self._rng = random.Random(int(seed)) if seed else random.Random()
+        except ValueError:
+            messagebox.showerror("种子错误", "随机种子必须是整数。")
+            raise
+        self._last_seed = seed
+
+    def _index_prizes(self) -> None:
+        self._prize_by_id = {prize.prize_id: prize for prize in self.prizes}
 
     def _refresh_prizes(self) -> None:
-        available = available_prizes(self.prizes, self.state)
-        options = [f"{prize.prize_id} - {prize.name} (剩余 {remaining_slots(prize, self.state)})" for prize in available]
-        self.prize_combo["values"] = options
+        self._index_prizes()
+        self._label_to_id = {}
+        for prize in self.prizes:
+            remaining = remaining_slots(prize, self.state)
+            if remaining > 0:
+                self._label_to_id[f"{prize.prize_id} - {prize.name} (剩余 {remaining})"] = prize.prize_id
+        options = list(self._label_to_id)
+        if options != self._prize_options:
+            # 选项未变（如本次未抽出新名单）时不再重设下拉列表
+            self._prize_options = options
+            self.prize_combo["values"] = options
         if options:
-            if self.prize_var.get() not in options:
+            if self.prize_var.get() not in self._label_to_id:
                 self.prize_var.set(options[0])
         else:
             self.prize_var.set("")
@@ -1378,19 +1692,49 @@ class LotteryApp:
         self.output_text.insert(tk.END, text + "\n")
         self.output_text.see(tk.END)
 
+    def _append_draw_results(self, entries: list[dict[str, Any]], footer: str | None = None) -> None:
+        # 整段（含可选的汇总行）拼好后一次 insert 并只滚动一次，避免每行各触发一次插入与滚动
+        lines = ["本次中奖名单:"]
+        lines.extend(
+            f"- {entry['prize_name']} | {entry['person_name']} ({entry['person_id']}) [{entry['source']}]"
+            for entry in entries
+        )
+        if footer:
+            lines.append(footer)
+        self._append_output("\n".join(lines))
+
     def _refresh_winners(self) -> None:
+        """Coalesce winner-list redraws requested in one event into a single idle-time redraw."""
+        if self._winners_refresh_pending:
+            return
+        self._winners_refresh_pending = True
+        self.root.after_idle(self._redraw_winners)
+
+    def _redraw_winners(self) -> None:
+        self._winners_refresh_pending = False
         self.output_text.delete("1.0", tk.END)
         if not self.state["winners"]:
             self._append_output("暂无中奖记录。")
             return
-        for winner in self.state["winners"]:
-            self._append_output(
-                f"{winner['timestamp']} | {winner['prize_name']} | {winner['person_name']} "
-                f"({winner['person_id']}) [{winner['source']}]"
-            )
+        self._append_output("\n".join(self._sync_winner_lines()))
+
+    def _sync_winner_lines(self) -> list[str]:
+        """Format only winners appended since the last call; rebuild if the list was replaced."""
+        winners = self.state["winners"]
+        lines = self._winner_lines
+        # 转存/抽奖只会在末尾追加（且共享已有条目），末项仍是同一对象即可增量格式化
+        if len(lines) > len(winners) or (lines and winners[len(lines) - 1] is not self._winner_lines_last):
+            lines.clear()
+        lines.extend(
+            f"{winner['timestamp']} | {winner['prize_name']} | {winner['person_name']} "
+            f"({winner['person_id']}) [{winner['source']}]"
+            for winner in winners[len(lines):]
+        )
+        self._winner_lines_last = winners[-1] if winners else None
+        return lines
 
-    def _current_excluded_ids(self) -> set[str]:
-        return {person.person_id for person in self.excluded_people}
+    def _current_excluded_ids(self) -> frozenset[str]:
+        return self._excluded_ids
 
     def _include_excluded_list(self) -> bool:
         return self.include_excluded_var.get()
@@ -1429,8 +1773,116 @@ class LotteryApp:
         return self.config.get("excluded_winners_min"), self.config.get("excluded_winners_max")
 
     def _persist_state(self) -> None:
-        save_state(self.state_path, self.state)
-        save_csv(self.csv_path, self.state["winners"])
+        # 与 save_state 一样在内存中的状态上记录生成时间，写入线程只写快照
+        self.state["generated_at"] = utc_now()
+        snapshot = {
+            **self.state,
+            "winners": list(self.state["winners"]),
+            "prizes": {
+                prize_id: {**bucket, "winners": list(bucket["winners"])}
+                for prize_id, bucket in self.state["prizes"].items()
+            },
+        }
+        state_path, csv_path = self.state_path, self.csv_path
+
+        def write() -> None:
+            try:
+                write_json(state_path, snapshot)
+                winners = snapshot["winners"]
+                # 磁盘上的 CSV 仍是上次写入的内容且为本次名单的前缀时只追加新增行，否则整体重写
+                written, written_size = self._csv_written.pop(csv_path, (None, -1))
+                if (
+                    written is not None
+                    and len(written) <= len(winners)
+                    and all(map(operator.is_, written, winners))
+                    and _file_size(csv_path) == written_size
+                ):
+                    append_csv(csv_path, winners[len(written):])
+                else:
+                    save_csv(csv_path, winners)
+                self._csv_written[csv_path] = (winners, _file_size(csv_path))
+            finally:
+                _invalidate_cached(state_path)
+
+        self._write_queue.put((("state", state_path, csv_path), write, None))
+        self._index_winners()
+
+    def _queue_data_write(
+        self,
+        writer: Callable[[Path, list[dict[str, Any]]], None],
+        path: Path,
+        data: list[dict[str, Any]],
+        done_message: str,
+    ) -> None:
+        snapshot = list(data)
+
+        def write() -> None:
+            try:
+                writer(path, snapshot)
+            finally:
+                _invalidate_cached(path)
+
+        self._write_queue.put((("data", path), write, done_message))
+
+    def _run_file_writer(self) -> None:
+        while True:
+            jobs = [self._write_queue.get()]
+            while True:
+                try:
+                    jobs.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            latest: dict[tuple[Any, ...], tuple[Callable[[], None], str | None]] = {}
+            for job in jobs:
+                if job is not None:
+                    latest[job[0]] = (job[1], job[2])
+            try:
+                for write, done_message in latest.values():
+                    # 单个写入失败（含非 OSError 的异常）不能终止线程，否则之后的 _flush_writes 会永远等待
+                    try:
+                        write()
+                    except Exception as exc:
+                        self._write_results.put(("error", str(exc)))
+                    else:
+                        if done_message:
+                            self._write_results.put(("done", done_message))
+            finally:
+                for _ in jobs:
+                    self._write_queue.task_done()
+            if None in jobs:
+                return
+
+    def _poll_write_results(self) -> None:
+        """Report finished background writes on the UI thread."""
+        self._drain_write_results()
+        self.root.after(200, self._poll_write_results)
+
+    def _drain_write_results(self) -> None:
+        while True:
+            try:
+                kind, message = self._write_results.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "error":
+                messagebox.showerror("保存失败", message)
+            else:
+                self._flash_status(message)
+
+    def _flush_writes(self) -> None:
+        """Block until every queued result/data write has reached disk."""
+        # 写入线程从不等待界面线程，这里阻塞等待不会死锁
+        self._write_queue.join()
+        self._drain_write_results()
+
+    def shutdown(self) -> None:
+        self._write_queue.put(None)
+        self._file_writer.join()
+
+    def _index_people(self) -> None:
+        self._all_names = [person.name for person in self.people]
+
+    def _index_winners(self) -> None:
+        self._winner_ids = frozenset(winner["person_id"] for winner in self.state["winners"])
 
     def _draw_selected(self) -> None:
         try:
@@ -1442,8 +1894,8 @@ class LotteryApp:
         if not selected_label:
             messagebox.showwarning("提示", "当前没有可抽奖项。")
             return
-        prize_id = selected_label.split(" - ", 1)[0]
-        prize = next((item for item in self.prizes if item.prize_id == prize_id), None)
+        prize_id = self._label_to_id.get(selected_label, selected_label)
+        prize = self._prize_by_id.get(prize_id)
         if not prize:
             messagebox.showerror("错误", f"未找到奖项: {prize_id}")
             return
@@ -1466,6 +1918,7 @@ class LotteryApp:
                 excluded_winner_range=excluded_range,
                 prizes=self.prizes,
                 draw_count=1,
+                rng=self._rng,
             )
         except ValueError as exc:
             messagebox.showerror("抽奖失败", str(exc))
@@ -1476,11 +1929,7 @@ class LotteryApp:
         if not selected:
             self._append_output("本次未抽出新的中奖名单。")
             return
-        self._append_output("本次中奖名单:")
-        for entry in selected:
-            self._append_output(
-                f"- {entry['prize_name']} | {entry['person_name']} ({entry['person_id']}) [{entry['source']}]"
-            )
+        self._append_draw_results(selected)
 
     def _draw_all(self) -> None:
         try:
@@ -1503,6 +1952,7 @@ class LotteryApp:
                         include_excluded=include_excluded,
                         excluded_winner_range=excluded_range,
                         prizes=self.prizes,
+                        rng=self._rng,
                     )
                 )
         except ValueError as exc:
@@ -1513,19 +1963,15 @@ class LotteryApp:
         if not selected_total:
             self._append_output("本次未抽出新的中奖名单。")
             return
-        self._append_output("本次中奖名单:")
-        for entry in selected_total:
-            self._append_output(
-                f"- {entry['prize_name']} | {entry['person_name']} ({entry['person_id']}) [{entry['source']}]"
-            )
-        excluded_range = self._get_excluded_winner_range()
+        footer = None
         min_value, max_value = excluded_range
         if (min_value is not None or max_value is not None) and not include_excluded:
             range_label = f"{min_value or 0}~{max_value if max_value is not None else '不限'}"
             excluded_total = sum(
                 1 for winner in self.state["winners"] if winner["person_id"] in excluded_ids
             )
-            self._append_output(f"排除名单中奖人数(全部奖项): {excluded_total}，范围: {range_label}")
+            footer = f"排除名单中奖人数(全部奖项): {excluded_total}，范围: {range_label}"
+        self._append_draw_results(selected_total, footer)
 
     def _reset_results(self) -> None:
         if not messagebox.askyesno("确认", "确定要清空所有中奖结果吗？"):
@@ -1536,6 +1982,7 @@ class LotteryApp:
         self._refresh_winners()
 
     def _reload_all(self) -> None:
+        self._flush_writes()
         self.config = self._load_config()
         self.admin_password = str(self.config.get("admin_password", ""))
         self.is_admin = False
@@ -1545,17 +1992,13 @@ class LotteryApp:
         self.output_dir = resolve_path(self.base_dir, self.config.get("output_dir", "output"))
         self.results_file = self.config.get("results_file", "results.json")
         self.results_csv = self.config.get("results_csv", "results.csv")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_output_dir()
         self.state_path = self.output_dir / self.results_file
         self.csv_path = self.output_dir / self.results_csv
 
-        self.people_data = self._load_people_data()
-        self.prizes_data = self._load_prizes_data()
-        self.excluded_data = self._load_excluded_data()
-        self.people = load_people(self.participants_file)
-        self.prizes = load_prizes(self.prizes_file)
-        self.excluded_people = load_excluded_people(self.excluded_file)
-        self.state = load_state(self.state_path)
+        self._load_data_files()
+        self._index_people()
+        self._index_winners()
         self.global_must_win = build_global_must_win(self.prizes)
 
         self.participants_path_var.set(str(self.participants_file))
@@ -1580,43 +2023,88 @@ class LotteryApp:
         messagebox.showinfo("完成", "配置与数据已重新加载。")
 
     def _refresh_people_tree(self) -> None:
-        self.people_tree.delete(*self.people_tree.get_children())
-        for index, person in enumerate(self.people_data):
-            self.people_tree.insert(
-                "",
-                tk.END,
-                iid=str(index),
-                values=(person.get("id", ""), person.get("name", ""), person.get("department", "")),
-            )
+        if not hasattr(self, "people_tree"):
+            return
+        rows = [self._person_row(person) for person in self.people_data]
+        self._populate_tree(self.people_tree, rows)
 
     def _refresh_prizes_tree(self) -> None:
-        self.prizes_tree.delete(*self.prizes_tree.get_children())
-        for index, prize in enumerate(self.prizes_data):
-            self.prizes_tree.insert(
-                "",
-                tk.END,
-                iid=str(index),
-                values=(
-                    prize.get("id", ""),
-                    prize.get("name", ""),
-                    prize.get("count", ""),
-                    prize.get("spin_speed_ratio", 1.0),
-                    "是" if prize.get("exclude_previous_winners", True) else "否",
-                    "是" if prize.get("exclude_must_win", True) else "否",
-                    "是" if prize.get("exclude_excluded_list", True) else "否",
-                    ",".join(prize.get("must_win_ids", [])),
-                ),
+        if not hasattr(self, "prizes_tree"):
+            return
+        rows = [
+            (
+                prize.get("id", ""),
+                prize.get("name", ""),
+                prize.get("count", ""),
+                prize.get("spin_speed_ratio", 1.0),
+                "是" if prize.get("exclude_previous_winners", True) else "否",
+                "是" if prize.get("exclude_must_win", True) else "否",
+                "是" if prize.get("exclude_excluded_list", True) else "否",
+                ",".join(prize.get("must_win_ids", [])),
             )
+            for prize in self.prizes_data
+        ]
+        # 只刷新当前显示的表格，另一套标记为过期，切换时再补刷
+        self._prize_rows = rows
+        active = self.prizes_tree
+        hidden = self.prizes_tree_basic if active is self.prizes_tree_admin else self.prizes_tree_admin
+        self._stale_prize_trees.add(str(hidden))
+        self._populate_tree(active, [row[: len(active["columns"])] for row in rows])
 
     def _refresh_excluded_tree(self) -> None:
-        self.excluded_tree.delete(*self.excluded_tree.get_children())
-        for index, person in enumerate(self.excluded_data):
-            self.excluded_tree.insert(
-                "",
-                tk.END,
-                iid=str(index),
-                values=(person.get("id", ""), person.get("name", ""), person.get("department", "")),
-            )
+        if not hasattr(self, "excluded_tree"):
+            return
+        rows = [self._person_row(person) for person in self.excluded_data]
+        self._populate_tree(self.excluded_tree, rows)
+
+    def _populate_tree(self, tree: ttk.Treeview, rows: list[tuple[Any, ...]]) -> None:
+        """Sync tree rows (iid == row index) to ``rows``, updating only rows that changed.
+
+        Only the rows already shown (at least one chunk) are materialized; the rest
+        are inserted by ``_on_tree_scroll`` as the view nears the bottom.
+        """
+        previous = self._tree_rows.get(str(tree), [])
+        self._tree_rows[str(tree)] = rows
+        if rows == previous:
+            # 整表无变化（如重新加载未改动的文件）：连 get_children 也不必调用
+            return
+        # 行按序号复用，旧选中项可能已指向别的数据，和重建整表一样清除选中
+        tree.selection_remove(tree.selection())
+        children = tree.get_children()
+        limit = min(len(rows), max(len(children), self.TREE_CHUNK_SIZE))
+        for index, (iid, values) in enumerate(zip(children[:limit], rows)):
+            # 与上次写入的值相同则跳过，单行编辑只产生一次 Tcl 调用
+            if index < len(previous) and previous[index] == values:
+                continue
+            tree.item(iid, values=values)
+        if len(children) > limit:
+            tree.delete(*children[limit:])
+        self._materialize_tree_rows(tree, limit)
+
+    def _materialize_tree_rows(self, tree: ttk.Treeview, count: int) -> None:
+        rows = self._tree_rows.get(str(tree), [])
+        insert = tree.insert
+        start = len(tree.get_children())
+        stop = min(count, len(rows))
+        for batch_start in range(start, stop, self.TREE_CHUNK_SIZE):
+            if batch_start > start:
+                # 跨多个分块补行时（如选中远处的行），每块之间让 Tk 处理一次重绘
+                tree.update_idletasks()
+            batch_stop = min(batch_start + self.TREE_CHUNK_SIZE, stop)
+            for iid, values in zip(_row_iids(batch_stop)[batch_start:batch_stop], rows[batch_start:batch_stop]):
+                insert("", tk.END, iid=iid, values=values)
+
+    def _on_tree_scroll(self, tree: ttk.Treeview, last: str) -> None:
+        if float(last) >= 0.8:
+            self._materialize_tree_rows(tree, len(tree.get_children()) + self.TREE_CHUNK_SIZE)
+
+    def _select_tree_row(self, tree: ttk.Treeview, index: int) -> None:
+        # 目标行通常已显示：先用 exists 判断，避免 get_children 拉取整列 iid
+        iid = _row_iids(index + 1)[index]
+        if not tree.exists(iid):
+            self._materialize_tree_rows(tree, index + 1)
+        tree.selection_set(iid)
+        tree.see(iid)
 
     def _selected_index(self, tree: ttk.Treeview) -> int | None:
         selection = tree.selection()
@@ -1672,22 +2160,18 @@ class LotteryApp:
         dialog.grab_set()
 
         is_admin = self.is_admin
-        prize_id_var = tk.StringVar(value="" if initial is None else str(initial.get("id", "")))
-        name_var = tk.StringVar(value="" if initial is None else str(initial.get("name", "")))
-        count_var = tk.StringVar(value="" if initial is None else str(initial.get("count", "")))
-        spin_speed_var = tk.StringVar(value=str(initial.get("spin_speed_ratio", 1.0) if initial else 1.0))
-        must_win_var = tk.StringVar(
-            value="" if initial is None else ",".join(initial.get("must_win_ids", []))
-        )
-        exclude_previous_var = tk.BooleanVar(
-            value=True if initial is None else bool(initial.get("exclude_previous_winners", True))
-        )
-        exclude_must_win_var = tk.BooleanVar(
-            value=True if initial is None else bool(initial.get("exclude_must_win", True))
-        )
-        exclude_excluded_var = tk.BooleanVar(
-            value=True if initial is None else bool(initial.get("exclude_excluded_list", True))
-        )
+        initial = initial or {}
+        initial_must_win_ids = list(initial.get("must_win_ids", []))
+        initial_exclude_must_win = bool(initial.get("exclude_must_win", True))
+        initial_exclude_excluded = bool(initial.get("exclude_excluded_list", True))
+        prize_id_var = tk.StringVar(value=str(initial.get("id", "")))
+        name_var = tk.StringVar(value=str(initial.get("name", "")))
+        count_var = tk.StringVar(value=str(initial.get("count", "")))
+        spin_speed_var = tk.StringVar(value=str(initial.get("spin_speed_ratio", 1.0)))
+        must_win_var = tk.StringVar(value=",".join(initial_must_win_ids))
+        exclude_previous_var = tk.BooleanVar(value=bool(initial.get("exclude_previous_winners", True)))
+        exclude_must_win_var = tk.BooleanVar(value=initial_exclude_must_win)
+        exclude_excluded_var = tk.BooleanVar(value=initial_exclude_excluded)
 
         ttk.Label(dialog, text="奖项ID:").grid(row=0, column=0, padx=10, pady=5, sticky=tk.W)
         ttk.Entry(dialog, textvariable=prize_id_var).grid(row=0, column=1, padx=10, pady=5)
@@ -1736,9 +2220,10 @@ class LotteryApp:
                 exclude_must_win = exclude_must_win_var.get()
                 exclude_excluded = exclude_excluded_var.get()
             else:
-                must_win_ids = [] if initial is None else list(initial.get("must_win_ids", []))
-                exclude_must_win = True if initial is None else bool(initial.get("exclude_must_win", True))
-                exclude_excluded = True if initial is None else bool(initial.get("exclude_excluded_list", True))
+                # 非管理员看不到这些字段，沿用打开对话框时的原值
+                must_win_ids = initial_must_win_ids
+                exclude_must_win = initial_exclude_must_win
+                exclude_excluded = initial_exclude_excluded
             nonlocal result
             result = {
                 "id": prize_id,
@@ -1763,292 +2248,279 @@ class LotteryApp:
         dialog.wait_window()
         return result
 
-    def _apply_people_change(self, new_data: list[dict[str, Any]]) -> bool:
+    def _apply_people_change(self, new_data: list[dict[str, Any]], error_title: str = "错误") -> bool:
         try:
             parse_people_entries(new_data)
         except ValueError as exc:
-            messagebox.showerror("错误", str(exc))
+            messagebox.showerror(error_title, str(exc))
             return False
         self.people_data = new_data
         self._refresh_people_tree()
         return True
 
-    def _apply_excluded_change(self, new_data: list[dict[str, Any]]) -> bool:
+    def _apply_excluded_change(self, new_data: list[dict[str, Any]], error_title: str = "错误") -> bool:
         try:
             parse_people_entries(new_data)
         except ValueError as exc:
-            messagebox.showerror("错误", str(exc))
+            messagebox.showerror(error_title, str(exc))
             return False
         self.excluded_data = new_data
         self._refresh_excluded_tree()
         return True
 
-    def _apply_prizes_change(self, new_data: list[dict[str, Any]]) -> bool:
+    def _apply_prizes_change(self, new_data: list[dict[str, Any]], error_title: str = "错误") -> bool:
         try:
             parse_prize_entries(new_data)
         except ValueError as exc:
-            messagebox.showerror("错误", str(exc))
+            messagebox.showerror(error_title, str(exc))
             return False
         self.prizes_data = new_data
         self._refresh_prizes_tree()
         return True
 
-    def _add_person(self) -> None:
-        result = self._open_person_dialog("新增人员")
-        if result is None:
-            return
-        new_data = [*self.people_data, result]
-        self._apply_people_change(new_data)
-
-    def _edit_person(self) -> None:
-        index = self._selected_index(self.people_tree)
-        if index is None:
-            messagebox.showwarning("提示", "请选择需要修改的人员。")
-            return
-        result = self._open_person_dialog("修改人员", self.people_data[index])
-        if result is None:
-            return
-        new_data = self.people_data.copy()
-        new_data[index] = result
-        self._apply_people_change(new_data)
-
-    def _delete_person(self) -> None:
-        index = self._selected_index(self.people_tree)
-        if index is None:
-            messagebox.showwarning("提示", "请选择需要删除的人员。")
-            return
-        new_data = self.people_data.copy()
-        del new_data[index]
-        self._apply_people_change(new_data)
-
-    def _move_person_up(self) -> None:
-        index = self._selected_index(self.people_tree)
-        if index is None or index == 0:
-            return
-        new_data = self.people_data.copy()
-        new_data[index - 1], new_data[index] = new_data[index], new_data[index - 1]
-        if self._apply_people_change(new_data):
-            self.people_tree.selection_set(str(index - 1))
-
-    def _move_person_down(self) -> None:
-        index = self._selected_index(self.people_tree)
-        if index is None or index >= len(self.people_data) - 1:
-            return
-        new_data = self.people_data.copy()
-        new_data[index + 1], new_data[index] = new_data[index], new_data[index + 1]
-        if self._apply_people_change(new_data):
-            self.people_tree.selection_set(str(index + 1))
-
-    def _add_excluded(self) -> None:
-        result = self._open_person_dialog("新增排除人员")
-        if result is None:
-            return
-        new_data = [*self.excluded_data, result]
-        self._apply_excluded_change(new_data)
+    def _apply_data_diff(
+        self,
+        kind: str,
+        op: str,
+        index: int,
+        entry: dict[str, Any] | None = None,
+        target: int = 0,
+    ) -> bool:
+        """Apply one add/edit/delete/swap to a data list in place and refresh its tree.
+
+        Swaps and deletes cannot make a valid list invalid, so only add/edit re-validate;
+        a rejected entry is rolled back instead of copying the list up front.
+        """
+        data_attr, parser, refresh_name = self._DATA_FAMILIES[kind]
+        data = getattr(self, data_attr)
+        if op == "swap":
+            data[index], data[target] = data[target], data[index]
+        elif op == "delete":
+            del data[index]
+        else:
+            previous = data[index] if op == "edit" else None
+            if op == "edit":
+                data[index] = entry
+            else:
+                data.insert(index, entry)
+            try:
+                parser(data)
+            except ValueError as exc:
+                if previous is None:
+                    del data[index]
+                else:
+                    data[index] = previous
+                messagebox.showerror("错误", str(exc))
+                return False
+        tree = getattr(self, self._EDITOR_UI[kind][0], None)
+        rows = self._tree_rows.get(str(tree)) if tree is not None else None
+        if kind != "prizes" and op in ("swap", "edit") and rows is not None and len(rows) == len(data):
+            # 交换/修改只影响一两行：直接修补行缓存与已显示的条目，不重建整表
+            self._patch_person_rows(tree, rows, data, (index, target) if op == "swap" else (index,))
+        elif kind != "prizes" and op == "delete" and rows is not None and len(rows) == len(data) + 1:
+            # 删除后其后的行上移一位：只改写已显示且值有变化的行，再去掉多出的末行
+            shown = rows.pop(index)
+            children = tree.get_children()
+            for iid, values in zip(children[index:], rows[index:]):
+                if values != shown:
+                    tree.item(iid, values=values)
+                shown = values
+            if len(children) > len(rows):
+                tree.delete(children[len(rows)])
+            # 选中项仍停在原序号上，不清除的话再次点删除会删掉下一个人
+            tree.selection_remove(tree.selection())
+        elif kind != "prizes" and op == "add" and rows is not None and index == len(rows) == len(data) - 1:
+            # 追加到末尾：行缓存与表格各补一行；前一行尚未显示时留给滚动懒加载
+            rows.append(self._person_row(entry))
+            if index == 0 or tree.exists(_row_iids(index)[index - 1]):
+                tree.insert("", tk.END, iid=_row_iids(index + 1)[index], values=rows[index])
+        else:
+            getattr(self, refresh_name)()
+        return True
 
-    def _edit_excluded(self) -> None:
-        index = self._selected_index(self.excluded_tree)
-        if index is None:
-            messagebox.showwarning("提示", "请选择需要修改的排除人员。")
-            return
-        result = self._open_person_dialog("修改排除人员", self.excluded_data[index])
+    @staticmethod
+    def _person_row(person: dict[str, Any]) -> tuple[Any, ...]:
+        return (person.get("id", ""), person.get("name", ""), person.get("department", ""))
+
+    def _patch_person_rows(
+        self,
+        tree: ttk.Treeview,
+        rows: list[tuple[Any, ...]],
+        data: list[dict[str, Any]],
+        indices: tuple[int, ...],
+    ) -> None:
+        for index in indices:
+            row = self._person_row(data[index])
+            if rows[index] == row:
+                continue
+            rows[index] = row
+            iid = _row_iids(index + 1)[index]
+            if tree.exists(iid):
+                tree.item(iid, values=row)
+
+    def _add_entry(self, kind: str) -> None:
+        _, dialog_name, noun = self._EDITOR_UI[kind]
+        result = getattr(self, dialog_name)(f"新增{noun}")
         if result is None:
             return
-        new_data = self.excluded_data.copy()
-        new_data[index] = result
-        self._apply_excluded_change(new_data)
+        self._apply_data_diff(kind, "add", len(getattr(self, self._DATA_FAMILIES[kind][0])), result)
 
-    def _delete_excluded(self) -> None:
-        index = self._selected_index(self.excluded_tree)
+    def _edit_entry(self, kind: str) -> None:
+        tree_attr, dialog_name, noun = self._EDITOR_UI[kind]
+        index = self._selected_index(getattr(self, tree_attr))
         if index is None:
-            messagebox.showwarning("提示", "请选择需要删除的排除人员。")
-            return
-        new_data = self.excluded_data.copy()
-        del new_data[index]
-        self._apply_excluded_change(new_data)
-
-    def _move_excluded_up(self) -> None:
-        index = self._selected_index(self.excluded_tree)
-        if index is None or index == 0:
-            return
-        new_data = self.excluded_data.copy()
-        new_data[index - 1], new_data[index] = new_data[index], new_data[index - 1]
-        if self._apply_excluded_change(new_data):
-            self.excluded_tree.selection_set(str(index - 1))
-
-    def _move_excluded_down(self) -> None:
-        index = self._selected_index(self.excluded_tree)
-        if index is None or index >= len(self.excluded_data) - 1:
+            messagebox.showwarning("提示", f"请选择需要修改的{noun}。")
             return
-        new_data = self.excluded_data.copy()
-        new_data[index + 1], new_data[index] = new_data[index], new_data[index + 1]
-        if self._apply_excluded_change(new_data):
-            self.excluded_tree.selection_set(str(index + 1))
-
-    def _add_prize(self) -> None:
-        result = self._open_prize_dialog("新增奖项")
+        data = getattr(self, self._DATA_FAMILIES[kind][0])
+        result = getattr(self, dialog_name)(f"修改{noun}", data[index])
         if result is None:
             return
-        new_data = [*self.prizes_data, result]
-        self._apply_prizes_change(new_data)
+        self._apply_data_diff(kind, "edit", index, result)
 
-    def _edit_prize(self) -> None:
-        index = self._selected_index(self.prizes_tree)
+    def _delete_entry(self, kind: str) -> None:
+        tree_attr, _, noun = self._EDITOR_UI[kind]
+        index = self._selected_index(getattr(self, tree_attr))
         if index is None:
-            messagebox.showwarning("提示", "请选择需要修改的奖项。")
-            return
-        result = self._open_prize_dialog("修改奖项", self.prizes_data[index])
-        if result is None:
+            messagebox.showwarning("提示", f"请选择需要删除的{noun}。")
             return
-        new_data = self.prizes_data.copy()
-        new_data[index] = result
-        self._apply_prizes_change(new_data)
+        self._apply_data_diff(kind, "delete", index)
 
-    def _delete_prize(self) -> None:
-        index = self._selected_index(self.prizes_tree)
+    def _move_entry(self, kind: str, step: int) -> None:
+        tree = getattr(self, self._EDITOR_UI[kind][0])
+        index = self._selected_index(tree)
         if index is None:
-            messagebox.showwarning("提示", "请选择需要删除的奖项。")
             return
-        new_data = self.prizes_data.copy()
-        del new_data[index]
-        self._apply_prizes_change(new_data)
-
-    def _move_prize_up(self) -> None:
-        index = self._selected_index(self.prizes_tree)
-        if index is None or index == 0:
-            return
-        new_data = self.prizes_data.copy()
-        new_data[index - 1], new_data[index] = new_data[index], new_data[index - 1]
-        if self._apply_prizes_change(new_data):
-            self.prizes_tree.selection_set(str(index - 1))
-
-    def _move_prize_down(self) -> None:
-        index = self._selected_index(self.prizes_tree)
-        if index is None or index >= len(self.prizes_data) - 1:
+        # 越界时夹回原位，统一为一次“未移动”判断
+        target = min(max(index + step, 0), len(getattr(self, self._DATA_FAMILIES[kind][0])) - 1)
+        if target == index:
             return
-        new_data = self.prizes_data.copy()
-        new_data[index + 1], new_data[index] = new_data[index], new_data[index + 1]
-        if self._apply_prizes_change(new_data):
-            self.prizes_tree.selection_set(str(index + 1))
+        if self._apply_data_diff(kind, "swap", index, target=target):
+            self._select_tree_row(tree, target)
 
     def _save_people(self) -> None:
-        if not self._apply_people_change(self.people_data):
+        # 编辑时表格已同步刷新，这里只需校验一次并复用解析结果
+        try:
+            people = parse_people_entries(self.people_data)
+        except ValueError as exc:
+            messagebox.showerror("错误", str(exc))
             return
-        write_people_data(self.participants_file, self.people_data)
-        self.people = parse_people_entries(self.people_data)
-        messagebox.showinfo("成功", "人员名单已保存。")
+        self._queue_data_write(write_people_data, self.participants_file, self.people_data, "人员名单已保存。")
+        self.people = people
+        self._index_people()
 
     def _save_prizes(self) -> None:
-        if not self._apply_prizes_change(self.prizes_data):
+        try:
+            prizes = parse_prize_entries(self.prizes_data)
+        except ValueError as exc:
+            messagebox.showerror("错误", str(exc))
             return
-        write_prizes_data(self.prizes_file, self.prizes_data)
-        self.prizes = parse_prize_entries(self.prizes_data)
+        self._queue_data_write(write_prizes_data, self.prizes_file, self.prizes_data, "奖项配置已保存。")
+        self.prizes = prizes
         self.global_must_win = build_global_must_win(self.prizes)
         self._refresh_prizes()
         if self.visual_window and self.visual_window.winfo_exists():
             self.visual_window.update_prizes(self.prizes, self.state)
         if self.wheel_window and self.wheel_window.winfo_exists():
             self.wheel_window.update_prizes(self.prizes, self.state)
-        messagebox.showinfo("成功", "奖项配置已保存。")
 
     def _save_excluded(self) -> None:
-        if not self._apply_excluded_change(self.excluded_data):
+        try:
+            excluded_people = parse_people_entries(self.excluded_data)
+        except ValueError as exc:
+            messagebox.showerror("错误", str(exc))
             return
-        write_people_data(self.excluded_file, self.excluded_data)
-        self.excluded_people = parse_people_entries(self.excluded_data)
-        messagebox.showinfo("成功", "排除名单已保存。")
+        self._queue_data_write(write_people_data, self.excluded_file, self.excluded_data, "排除名单已保存。")
+        self.excluded_people = excluded_people
+        self._excluded_ids = frozenset(person.person_id for person in self.excluded_people)
 
     def _import_people(self) -> None:
         path = filedialog.askopenfilename(
             title="选择要导入的名单文件",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         path_obj = Path(path)
+        # 所选文件可能正是后台队列中待写入的数据文件，先等写入完成再读取
+        self._flush_writes()
         try:
+            # 一次性导入的文件直接读取，不放进文件缓存
             data = read_people_data(path_obj)
         except (FileNotFoundError, json.JSONDecodeError, ValueError) as exc:
             messagebox.showerror("导入失败", f"无法读取 {path_obj}: {exc}")
             return
-        try:
-            parse_people_entries(data)
-        except ValueError as exc:
-            messagebox.showerror("导入失败", str(exc))
-            return
-        self._apply_people_change(data)
+        self._apply_people_change(data, error_title="导入失败")
 
     def _export_people(self) -> None:
         path = filedialog.asksaveasfilename(
             title="选择导出位置",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         write_people_data(Path(path), self.people_data)
+        _invalidate_cached(Path(path))
         messagebox.showinfo("导出完成", f"已导出到 {path}")
 
     def _import_prizes(self) -> None:
         path = filedialog.askopenfilename(
             title="选择要导入的奖项文件",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         path_obj = Path(path)
+        # 所选文件可能正是后台队列中待写入的数据文件，先等写入完成再读取
+        self._flush_writes()
         try:
+            # 一次性导入的文件直接读取，不放进文件缓存
             data = read_prizes_data(path_obj)
         except (FileNotFoundError, json.JSONDecodeError, ValueError) as exc:
             messagebox.showerror("导入失败", f"无法读取 {path_obj}: {exc}")
             return
-        try:
-            parse_prize_entries(data)
-        except ValueError as exc:
-            messagebox.showerror("导入失败", str(exc))
-            return
-        self._apply_prizes_change(data)
+        self._apply_prizes_change(data, error_title="导入失败")
 
     def _export_prizes(self) -> None:
         path = filedialog.asksaveasfilename(
             title="选择导出位置",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         write_prizes_data(Path(path), self.prizes_data)
+        _invalidate_cached(Path(path))
         messagebox.showinfo("导出完成", f"已导出到 {path}")
 
     def _import_excluded(self) -> None:
         path = filedialog.askopenfilename(
             title="选择要导入的排除名单",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         path_obj = Path(path)
+        # 所选文件可能正是后台队列中待写入的数据文件，先等写入完成再读取
+        self._flush_writes()
         try:
+            # 一次性导入的文件直接读取，不放进文件缓存
             data = read_people_data(path_obj)
         except (FileNotFoundError, json.JSONDecodeError, ValueError) as exc:
             messagebox.showerror("导入失败", f"无法读取 {path_obj}: {exc}")
             return
-        try:
-            parse_people_entries(data)
-        except ValueError as exc:
-            messagebox.showerror("导入失败", str(exc))
-            return
-        self._apply_excluded_change(data)
+        self._apply_excluded_change(data, error_title="导入失败")
 
     def _export_excluded(self) -> None:
         path = filedialog.asksaveasfilename(
             title="选择导出位置",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("JSON files", "*.json")],
+            **_DATA_FILE_DIALOG,
         )
         if not path:
             return
         write_people_data(Path(path), self.excluded_data)
+        _invalidate_cached(Path(path))
         messagebox.showinfo("导出完成", f"已导出到 {path}")
 
 
@@ -2059,6 +2531,7 @@ def main() -> None:
     root = tk.Tk()
     app = LotteryApp(root, config_path)
     root.mainloop()
+    app.shutdown()
 
 
 if __name__ == "__main__":
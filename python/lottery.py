@@ -12,16 +12,31 @@ from __future__ import annotations
 
 import argparse
 import csv
+import importlib
+import importlib.util
 import json
+import os
 import random
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional
 
+_orjson_spec = importlib.util.find_spec("orjson")
+if _orjson_spec is None:
+    orjson = None
+else:
+    orjson = importlib.import_module("orjson")
 
-@dataclass
+# pyarrow 导入较慢，只在读取大文件时才按需导入
+_pyarrow_spec = importlib.util.find_spec("pyarrow")
+# 小于该大小的名单直接用 csv 模块解析，导入 pyarrow 的开销反而更大
+_ARROW_CSV_MIN_BYTES = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
 class PrizeConfig:
     prize_id: str
     name: str
@@ -33,21 +48,38 @@ class PrizeConfig:
     spin_speed_ratio: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Person:
     person_id: str
     name: str
     department: str
 
 
+# Large read buffer so big CSV exports are parsed with few read() syscalls.
+_CSV_READ_BUFFER = 1 << 20
+# Same for writes: rows are serialized in one writerows() call into a 1 MiB buffer.
+_CSV_WRITE_BUFFER = 1 << 20
+
+
 def read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    # orjson.JSONDecodeError 继承自 json.JSONDecodeError，调用方的异常处理无需区分后端。
+    # 两种后端都直接解析整块字节，省去文本包装层的逐段解码
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def write_json(path: Path, payload: Any) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        # json.dump 会把每个片段单独 write 一次；先整体序列化再一次写入
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    # 先写临时文件再替换，读取方不会看到写了一半的 JSON
+    temp_path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
 
 
 def _parse_bool(value: Any, default: bool = True) -> bool:
@@ -108,7 +140,14 @@ def resolve_path(base_dir: Path, raw_path: str) -> Path:
 
 
 def _read_people_csv(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+    if _pyarrow_spec is not None and path.stat().st_size >= _ARROW_CSV_MIN_BYTES:
+        pa = importlib.import_module("pyarrow")
+        try:
+            return _read_people_csv_arrow(path)
+        except (pa.ArrowInvalid, KeyError):
+            # 多余字段、重复表头等 pyarrow 不接受的格式，交给 csv 模块按原逻辑处理
+            pass
+    with path.open("r", encoding="utf-8-sig", newline="", buffering=_CSV_READ_BUFFER) as handle:
         reader = csv.DictReader(handle)
         return [
             {
@@ -121,8 +160,37 @@ def _read_people_csv(path: Path) -> List[Dict[str, Any]]:
         ]
 
 
+def _read_people_csv_arrow(path: Path) -> List[Dict[str, Any]]:
+    """Parse a roster CSV with pyarrow's multithreaded reader; same rows as the csv-module path."""
+    pa = importlib.import_module("pyarrow")
+    pa_csv = importlib.import_module("pyarrow.csv")
+    fields = ("id", "name", "department")
+    table = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={field: pa.string() for field in fields},
+            strings_can_be_null=False,
+        ),
+    )
+    columns = [
+        table.column(field).to_pylist() if field in table.column_names else [""] * table.num_rows
+        for field in fields
+    ]
+    # 与 csv 模块一致：跳过所有列都为空的行（其余列也要检查）
+    others = [table.column(name).to_pylist() for name in table.column_names if name not in fields]
+    data: List[Dict[str, Any]] = []
+    for index, (person_id, name, department) in enumerate(zip(*columns)):
+        if not (person_id or name or department) and not any(
+            column[index] not in (None, "") for column in others
+        ):
+            continue
+        data.append({"id": person_id.strip(), "name": name.strip(), "department": department.strip()})
+    return data
+
+
 def _read_prizes_csv(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+    with path.open("r", encoding="utf-8-sig", newline="", buffering=_CSV_READ_BUFFER) as handle:
         reader = csv.DictReader(handle)
         data: List[Dict[str, Any]] = []
         for row in reader:
@@ -146,11 +214,10 @@ def _read_prizes_csv(path: Path) -> List[Dict[str, Any]]:
 
 def _write_people_csv(path: Path, payload: Iterable[Dict[str, Any]]) -> None:
     fieldnames = ["id", "name", "department"]
-    with path.open("w", encoding="utf-8-sig", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in payload:
-            writer.writerow({key: row.get(key, "") for key in fieldnames})
+    with path.open("w", encoding="utf-8-sig", newline="", buffering=_CSV_WRITE_BUFFER) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows([row.get(key, "") for key in fieldnames] for row in payload)
 
 
 def _write_prizes_csv(path: Path, payload: Iterable[Dict[str, Any]]) -> None:
@@ -164,22 +231,22 @@ def _write_prizes_csv(path: Path, payload: Iterable[Dict[str, Any]]) -> None:
         "must_win_ids",
         "spin_speed_ratio",
     ]
-    with path.open("w", encoding="utf-8-sig", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in payload:
-            writer.writerow(
-                {
-                    "id": row.get("id", ""),
-                    "name": row.get("name", ""),
-                    "count": row.get("count", ""),
-                    "exclude_previous_winners": row.get("exclude_previous_winners", True),
-                    "exclude_must_win": row.get("exclude_must_win", True),
-                    "exclude_excluded_list": row.get("exclude_excluded_list", True),
-                    "must_win_ids": ",".join(row.get("must_win_ids", [])),
-                    "spin_speed_ratio": row.get("spin_speed_ratio", 1.0),
-                }
+    with path.open("w", encoding="utf-8-sig", newline="", buffering=_CSV_WRITE_BUFFER) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                row.get("id", ""),
+                row.get("name", ""),
+                row.get("count", ""),
+                row.get("exclude_previous_winners", True),
+                row.get("exclude_must_win", True),
+                row.get("exclude_excluded_list", True),
+                ",".join(row.get("must_win_ids", [])),
+                row.get("spin_speed_ratio", 1.0),
             )
+            for row in payload
+        )
 
 
 def read_people_data(path: Path) -> List[Dict[str, Any]]:
@@ -217,20 +284,25 @@ def write_prizes_data(path: Path, payload: Iterable[Dict[str, Any]]) -> None:
 def parse_people_entries(raw_people: Iterable[Dict[str, Any]]) -> List[Person]:
     if not isinstance(raw_people, list):
         raise ValueError("Participants data must be a list of objects.")
-    people = []
-    seen_ids = set()
+    people: List[Person] = []
+    append = people.append
+    seen_ids: set[str] = set()
+    seen_add = seen_ids.add
+    intern = sys.intern
     for entry in raw_people:
-        person_id = str(entry.get("id", "")).strip()
-        name = str(entry.get("name", "")).strip()
+        get = entry.get
+        # 工号驻留后，人员、排除名单与保底名单中的同一工号是同一对象，集合查找可直接按身份命中
+        person_id = intern(str(get("id", "")).strip())
+        name = str(get("name", "")).strip()
         if not person_id or not name:
             raise ValueError(f"Invalid participant entry: {entry}")
         if person_id in seen_ids:
             raise ValueError(f"Duplicate participant id: {person_id}")
-        seen_ids.add(person_id)
-        department = str(entry.get("department", "")).strip()
+        seen_add(person_id)
+        department = str(get("department", "")).strip()
         if not department:
             raise ValueError(f"Invalid participant entry (missing department): {entry}")
-        people.append(Person(person_id=person_id, name=name, department=department))
+        append(Person(person_id, name, department))
     return people
 
 
@@ -261,7 +333,7 @@ def parse_prize_entries(raw_prizes: Iterable[Dict[str, Any]]) -> List[PrizeConfi
                 exclude_previous_winners=bool(entry.get("exclude_previous_winners", True)),
                 exclude_must_win=bool(entry.get("exclude_must_win", True)),
                 exclude_excluded_list=bool(entry.get("exclude_excluded_list", True)),
-                must_win_ids=[str(item) for item in entry.get("must_win_ids", [])],
+                must_win_ids=[sys.intern(str(item)) for item in entry.get("must_win_ids", [])],
                 spin_speed_ratio=_parse_speed_ratio(entry.get("spin_speed_ratio", 1.0)),
             )
         )
@@ -298,21 +370,40 @@ def save_state(state_path: Path, state: Dict[str, Any]) -> None:
     write_json(state_path, state)
 
 
+_RESULT_CSV_FIELDS = (
+    "timestamp",
+    "prize_id",
+    "prize_name",
+    "person_id",
+    "person_name",
+    "department",
+    "source",
+)
+
+
 def save_csv(csv_path: Path, winners: Iterable[Dict[str, Any]]) -> None:
-    fieldnames = [
-        "timestamp",
-        "prize_id",
-        "prize_name",
-        "person_id",
-        "person_name",
-        "department",
-        "source",
-    ]
-    with csv_path.open("w", encoding="utf-8-sig", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for winner in winners:
-            writer.writerow({key: winner.get(key, "") for key in fieldnames})
+    with csv_path.open("w", encoding="utf-8-sig", newline="", buffering=_CSV_WRITE_BUFFER) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(_RESULT_CSV_FIELDS)
+        writer.writerows([winner.get(key, "") for key in _RESULT_CSV_FIELDS] for winner in winners)
+
+
+def append_csv(csv_path: Path, winners: Iterable[Dict[str, Any]]) -> None:
+    """Append winner rows to a results CSV previously written by ``save_csv``."""
+    # 文件头（含 BOM）已存在，追加部分按普通 UTF-8 写入
+    with csv_path.open("a", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER) as handle:
+        csv.writer(handle).writerows([winner.get(key, "") for key in _RESULT_CSV_FIELDS] for winner in winners)
+
+
+def fork_state(state: Dict[str, Any], prize_id: str) -> Dict[str, Any]:
+    """Copy only the containers ``draw_prize`` appends to for ``prize_id``.
+
+    Winner entries and the other prizes' buckets are shared with ``state``.
+    """
+    prizes_state = dict(state["prizes"])
+    prize_state = prizes_state.get(prize_id, {"winners": []})
+    prizes_state[prize_id] = {**prize_state, "winners": list(prize_state["winners"])}
+    return {**state, "winners": list(state["winners"]), "prizes": prizes_state}
 
 
 def build_global_must_win(prizes: List[PrizeConfig]) -> set[str]:
@@ -336,21 +427,23 @@ def draw_prize(
     people: List[Person],
     state: Dict[str, Any],
     global_must_win: set[str],
-    excluded_ids: Optional[set[str]] = None,
+    excluded_ids: Optional[AbstractSet[str]] = None,
     include_excluded: bool = False,
     excluded_winner_range: tuple[int | None, int | None] | None = None,
     prizes: Optional[List[PrizeConfig]] = None,
     draw_count: int | None = None,
+    rng: Optional[random.Random] = None,
 ) -> List[Dict[str, Any]]:
+    # 未传入 rng 时沿用模块级随机数（CLI 的 --seed 通过 random.seed 生效）
+    randint = rng.randint if rng is not None else random.randint
+    sample = rng.sample if rng is not None else random.sample
     prize_state = state["prizes"].setdefault(prize.prize_id, {"winners": []})
     existing_prize_winners = set(prize_state["winners"])
     existing_global_winners = {winner["person_id"] for winner in state["winners"]}
-    excluded_ids = excluded_ids or set()
+    excluded_ids = excluded_ids or frozenset()
     exclude_excluded_list = prize.exclude_excluded_list and not include_excluded
-    if not exclude_excluded_list:
-        exclusion_blocklist = set()
-    else:
-        exclusion_blocklist = set(excluded_ids)
+    # 只做成员判断，直接复用调用方传入的集合，无需再复制一份
+    exclusion_blocklist = excluded_ids if exclude_excluded_list else frozenset()
 
     remaining = remaining_slots(prize, state)
     if remaining <= 0:
@@ -377,6 +470,8 @@ def draw_prize(
     selected_ids = set()
     excluded_selected_count = 0
 
+    # 保底名单按工号直接查表，避免每个保底 id 都线性扫描一遍人员名单
+    people_by_id = {person.person_id: person for person in people} if prize.must_win_ids else {}
     for must_id in prize.must_win_ids:
         if remaining <= len(selected):
             break
@@ -384,7 +479,7 @@ def draw_prize(
             continue
         if exclude_excluded_list and must_id in excluded_ids:
             continue
-        match = next((person for person in people if person.person_id == must_id), None)
+        match = people_by_id.get(must_id)
         if not match:
             continue
         selected.append(
@@ -411,30 +506,24 @@ def draw_prize(
             and not prize.exclude_excluded_list
         )
         if apply_excluded_range:
-            prize_lookup = {item.prize_id: item for item in prizes}
-            total_remaining_slots = sum(remaining_slots(item, state) for item in prizes)
-            remaining_slots_after = total_remaining_slots - remaining
+            # 每个奖项的剩余名额只算一次，中奖记录也只遍历一遍
+            slots_by_prize = {item.prize_id: remaining_slots(item, state) for item in prizes}
+            remaining_slots_after = sum(slots_by_prize.values()) - remaining
             applicable_prize_ids = {
                 item.prize_id
                 for item in prizes
                 if not item.exclude_excluded_list
             }
             remaining_applicable_prize_ids = {
-                item.prize_id
-                for item in prizes
-                if remaining_slots(item, state) > 0 and not item.exclude_excluded_list
+                prize_id for prize_id in applicable_prize_ids if slots_by_prize[prize_id] > 0
             }
-            existing_applicable_total = sum(
-                1
-                for entry in state["winners"]
-                if entry["prize_id"] in applicable_prize_ids
-            )
-            existing_excluded_total = sum(
-                1
-                for entry in state["winners"]
-                if entry["person_id"] in excluded_ids
-                and entry["prize_id"] in applicable_prize_ids
-            )
+            existing_applicable_total = 0
+            existing_excluded_total = 0
+            for entry in state["winners"]:
+                if entry["prize_id"] in applicable_prize_ids:
+                    existing_applicable_total += 1
+                    if entry["person_id"] in excluded_ids:
+                        existing_excluded_total += 1
             min_excluded, max_excluded = excluded_winner_range
             min_excluded = 0 if min_excluded is None else min_excluded
             if min_excluded < 0:
@@ -527,14 +616,14 @@ def draw_prize(
             excluded_count = (
                 min_excluded_allowed
                 if min_excluded_allowed == max_excluded_allowed
-                else random.randint(min_excluded_allowed, max_excluded_allowed)
+                else randint(min_excluded_allowed, max_excluded_allowed)
             )
             non_excluded_needed = remaining - excluded_count
             if non_excluded_needed > len(non_excluded_pool):
                 raise ValueError("非排除名单人数不足，无法满足最大中奖人数限制。")
 
             if excluded_count:
-                for person in random.sample(excluded_pool, excluded_count):
+                for person in sample(excluded_pool, excluded_count):
                     selected.append(
                         {
                             "timestamp": utc_now(),
@@ -550,7 +639,7 @@ def draw_prize(
                     excluded_selected_count += 1
 
             if non_excluded_needed:
-                for person in random.sample(non_excluded_pool, non_excluded_needed):
+                for person in sample(non_excluded_pool, non_excluded_needed):
                     selected.append(
                         {
                             "timestamp": utc_now(),
@@ -567,7 +656,7 @@ def draw_prize(
             random_pool = [person for person in eligible_people if person.person_id not in selected_ids]
             if remaining > len(random_pool):
                 remaining = len(random_pool)
-            for person in random.sample(random_pool, remaining):
+            for person in sample(random_pool, remaining):
                 selected.append(
                     {
                         "timestamp": utc_now(),
@@ -649,7 +738,7 @@ def main() -> None:
     state = load_state(state_path)
     global_must_win = build_global_must_win(prizes)
     excluded_people = load_excluded_people(excluded_file)
-    excluded_ids = {person.person_id for person in excluded_people}
+    excluded_ids = frozenset(person.person_id for person in excluded_people)
 
     if args.command == "show":
         if not state["winners"]:
@@ -0,0 +1,27 @@
+import queue
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app  # noqa: E402
+
+
+@pytest.fixture
+def writer_app(tmp_path):
+    """A LotteryApp with only the background file writer wired up (no Tk root)."""
+    lottery_app = app.LotteryApp.__new__(app.LotteryApp)
+    lottery_app._csv_written = {}
+    lottery_app._write_queue = queue.Queue()
+    lottery_app._write_results = queue.Queue()
+    lottery_app._file_writer = threading.Thread(target=lottery_app._run_file_writer, daemon=True)
+    lottery_app._file_writer.start()
+    lottery_app.state_path = tmp_path / "results.json"
+    lottery_app.csv_path = tmp_path / "results.csv"
+    lottery_app.state = {"version": 1, "generated_at": "", "winners": [], "prizes": {}}
+    lottery_app._index_winners = lambda: None
+    yield lottery_app
+    lottery_app.shutdown()
@@ -0,0 +1,68 @@
+import random
+
+import app
+from lottery import Person, PrizeConfig, draw_prize, fork_state, save_csv
+
+PEOPLE = [Person(str(i), f"员工{i}", "部门") for i in range(30)]
+PRIZE = PrizeConfig("p1", "一等奖", 20, True, False, False, [])
+
+
+def _draw(lottery_app, count, seed):
+    """Draw ``count`` winners into a forked state and persist it, as _transfer_draw does."""
+    state = fork_state(lottery_app.state, PRIZE.prize_id)
+    draw_prize(PRIZE, PEOPLE, state, set(), draw_count=count, rng=random.Random(seed))
+    lottery_app.state = state
+    lottery_app._persist_state()
+    lottery_app._flush_writes()
+
+
+def _assert_matches_full_rewrite(lottery_app, tmp_path):
+    expected = tmp_path / "expected.csv"
+    save_csv(expected, lottery_app.state["winners"])
+    assert lottery_app.csv_path.read_bytes() == expected.read_bytes()
+
+
+def test_successive_draws_append_same_bytes_as_rewrite(writer_app, tmp_path, monkeypatch):
+    appended = []
+    append_csv = app.append_csv
+    monkeypatch.setattr(app, "append_csv", lambda path, rows: (appended.append(len(rows)), append_csv(path, rows)))
+    for seed in range(4):
+        _draw(writer_app, 3, seed)
+        _assert_matches_full_rewrite(writer_app, tmp_path)
+    assert len(writer_app.state["winners"]) == 12
+    # 首次整体写入，之后三次抽奖都只追加新增的行
+    assert appended == [3, 3, 3]
+
+
+def test_reset_rewrites_csv(writer_app, tmp_path):
+    _draw(writer_app, 5, 1)
+    writer_app.state = {"version": 1, "generated_at": "", "winners": [], "prizes": {}}
+    writer_app._persist_state()
+    writer_app._flush_writes()
+    _assert_matches_full_rewrite(writer_app, tmp_path)
+    _draw(writer_app, 2, 2)
+    _assert_matches_full_rewrite(writer_app, tmp_path)
+
+
+def test_external_truncation_falls_back_to_rewrite(writer_app, tmp_path):
+    _draw(writer_app, 4, 3)
+    with writer_app.csv_path.open("r+b") as handle:
+        handle.truncate(10)
+    _draw(writer_app, 2, 4)
+    _assert_matches_full_rewrite(writer_app, tmp_path)
+
+
+def test_deleted_csv_is_recreated(writer_app, tmp_path):
+    _draw(writer_app, 4, 5)
+    writer_app.csv_path.unlink()
+    _draw(writer_app, 1, 6)
+    _assert_matches_full_rewrite(writer_app, tmp_path)
+
+
+def test_replaced_winner_list_rewrites_csv(writer_app, tmp_path):
+    _draw(writer_app, 4, 7)
+    # 同样长度但条目不是同一批对象（如重新加载结果文件）时不能走追加
+    writer_app.state = {**writer_app.state, "winners": [dict(entry) for entry in writer_app.state["winners"][:2]]}
+    writer_app._persist_state()
+    writer_app._flush_writes()
+    _assert_matches_full_rewrite(writer_app, tmp_path)
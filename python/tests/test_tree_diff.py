@@ -0,0 +1,132 @@
+import pytest
+
+import app
+
+
+class FakeTree:
+    """The slice of ttk.Treeview that _populate_tree / _apply_data_diff use."""
+
+    def __init__(self):
+        self.values = {}
+        self.order = []
+        self.selected = ()
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+    def insert(self, parent, index, iid, values):
+        self.order.append(iid)
+        self.values[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+            del self.values[iid]
+
+    def exists(self, iid):
+        return iid in self.values
+
+    def update_idletasks(self):
+        pass
+
+    def selection(self):
+        return self.selected
+
+    def selection_remove(self, items):
+        self.selected = tuple(iid for iid in self.selected if iid not in items)
+
+    def __str__(self):
+        return ".people"
+
+
+def _person(index):
+    return {"id": f"E{index:03d}", "name": f"员工{index}", "department": "研发"}
+
+
+@pytest.fixture
+def people_app(monkeypatch):
+    monkeypatch.setattr(app.LotteryApp, "TREE_CHUNK_SIZE", 3)
+    errors = []
+    monkeypatch.setattr(app.messagebox, "showerror", lambda title, message: errors.append(message))
+    lottery_app = app.LotteryApp.__new__(app.LotteryApp)
+    lottery_app._tree_rows = {}
+    lottery_app.people_tree = FakeTree()
+    lottery_app.people_data = [_person(index) for index in range(8)]
+    lottery_app.errors = errors
+    lottery_app._refresh_people_tree()
+    return lottery_app
+
+
+def _assert_tree_matches_data(lottery_app):
+    """The row cache mirrors the data and every materialized row shows the right values."""
+    tree = lottery_app.people_tree
+    expected = [lottery_app._person_row(person) for person in lottery_app.people_data]
+    assert lottery_app._tree_rows[str(tree)] == expected
+    shown = len(tree.order)
+    assert shown <= len(expected)
+    assert tree.order == app._row_iids(shown)[:shown]
+    assert [tree.values[iid] for iid in tree.order] == expected[:shown]
+
+
+def test_initial_populate_materializes_one_chunk(people_app):
+    assert len(people_app.people_tree.order) == 3
+    _assert_tree_matches_data(people_app)
+
+
+@pytest.mark.parametrize(
+    ("op", "index", "target"),
+    [("swap", 0, 1), ("swap", 2, 6), ("swap", 6, 7), ("delete", 0, 0), ("delete", 2, 0), ("delete", 7, 0)],
+)
+def test_swap_and_delete_match_full_refresh(people_app, op, index, target):
+    assert people_app._apply_data_diff("people", op, index, target=target)
+    _assert_tree_matches_data(people_app)
+
+
+def test_edit_and_append_match_full_refresh(people_app):
+    assert people_app._apply_data_diff("people", "edit", 1, {**_person(1), "name": "改名"})
+    _assert_tree_matches_data(people_app)
+    # 末行尚未显示时追加只更新行缓存，留给滚动懒加载
+    assert people_app._apply_data_diff("people", "add", 8, _person(8))
+    assert len(people_app.people_tree.order) == 3
+    _assert_tree_matches_data(people_app)
+    # 插入到中间走整表刷新
+    assert people_app._apply_data_diff("people", "add", 1, _person(9))
+    _assert_tree_matches_data(people_app)
+
+
+def test_append_to_fully_shown_tree_inserts_row(people_app):
+    people_app._materialize_tree_rows(people_app.people_tree, len(people_app.people_data))
+    assert people_app._apply_data_diff("people", "add", 8, _person(8))
+    assert len(people_app.people_tree.order) == 9
+    _assert_tree_matches_data(people_app)
+
+
+def test_deleting_down_to_empty(people_app):
+    for _ in range(len(people_app.people_data)):
+        assert people_app._apply_data_diff("people", "delete", 0)
+        _assert_tree_matches_data(people_app)
+    assert people_app.people_tree.order == []
+
+
+def test_invalid_edit_is_rolled_back(people_app):
+    before = list(people_app.people_data)
+    assert not people_app._apply_data_diff("people", "edit", 2, {**_person(2), "id": "E000"})
+    assert people_app.people_data == before
+    assert people_app.errors
+    _assert_tree_matches_data(people_app)
+
+
+def test_invalid_add_is_rolled_back(people_app):
+    before = list(people_app.people_data)
+    assert not people_app._apply_data_diff("people", "add", 3, {"id": "", "name": "空", "department": "研发"})
+    assert people_app.people_data == before
+    _assert_tree_matches_data(people_app)
+
+
+def test_delete_clears_selection(people_app):
+    people_app.people_tree.selected = ("1",)
+    assert people_app._apply_data_diff("people", "delete", 1)
+    assert people_app.people_tree.selection() == ()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import io
 import math
 import random
 import time
@@ -36,7 +37,7 @@ class VisualLotteryWindow(tk.Toplevel):
         people: list[Any],
         state: dict[str, Any],
         global_must_win: set[str],
-        excluded_ids: set[str],
+        excluded_ids: set[str] | frozenset[str],
         include_excluded: bool,
         excluded_winner_range: tuple[int | None, int | None] | None,
         background_color: str,
@@ -46,6 +47,9 @@ class VisualLotteryWindow(tk.Toplevel):
         screen_geometry: dict[str, int] | None,
         on_complete: Callable[[list[dict[str, Any]]], None],
         on_close: Callable[[], None],
+        win_sound_data: bytes | None = None,
+        background_data: bytes | None = None,
+        background_music_data: bytes | None = None,
     ) -> None:
         super().__init__(root)
         self.root = root
@@ -62,6 +66,9 @@ class VisualLotteryWindow(tk.Toplevel):
         self.background_path = background_path
         self.background_music_path = background_music_path
         self.win_sound_path = win_sound_path
+        self.win_sound_data = win_sound_data
+        self.background_data = background_data
+        self.background_music_data = background_music_data
         self.screen_geometry = screen_geometry
         self.on_complete = on_complete
         self.on_close = on_close
@@ -139,6 +146,7 @@ class VisualLotteryWindow(tk.Toplevel):
         self.audio_ready = False
         self.win_sound = None
         self.music_ready = False
+        self._music_buffer: io.BytesIO | None = None
 
         self._refresh_prize_options()
         self._load_background()
@@ -225,11 +233,15 @@ class VisualLotteryWindow(tk.Toplevel):
         self.canvas.configure(bg=self.background_color)
         if not self.background_path:
             return
-        path = resolve_path(self.base_dir, self.background_path)
-        if not path.exists():
-            return
         if self.background_original is None:
-            self.background_original = Image.open(path)
+            if self.background_data:
+                # Preloaded by the caller, so no disk access on the UI thread.
+                self.background_original = Image.open(io.BytesIO(self.background_data))
+            else:
+                path = resolve_path(self.base_dir, self.background_path)
+                if not path.exists():
+                    return
+                self.background_original = Image.open(path)
         width = self.winfo_width()
         height = self.winfo_height()
         if width <= 1 or height <= 1:
@@ -248,14 +260,22 @@ class VisualLotteryWindow(tk.Toplevel):
         try:
             if not pygame.mixer.get_init():
                 pygame.mixer.init()
-            if self.win_sound_path:
-                path = resolve_path(self.base_dir, self.win_sound_path)
-            else:
-                path = None
-            if path and path.exists():
-                self.win_sound = pygame.mixer.Sound(str(path))
+            if self.win_sound_data:
+                # Preloaded by the caller, so no disk access on the UI thread.
+                self.win_sound = pygame.mixer.Sound(file=io.BytesIO(self.win_sound_data))
                 self.audio_ready = True
-            if self.background_music_path:
+            elif self.win_sound_path:
+                path = resolve_path(self.base_dir, self.win_sound_path)
+                if path.exists():
+                    self.win_sound = pygame.mixer.Sound(str(path))
+                    self.audio_ready = True
+            if self.background_music_data:
+                # pygame streams music from the buffer while playing, so keep it referenced.
+                self._music_buffer = io.BytesIO(self.background_music_data)
+                pygame.mixer.music.load(self._music_buffer, Path(self.background_music_path).suffix.lstrip("."))
+                pygame.mixer.music.play(-1)
+                self.music_ready = True
+            elif self.background_music_path:
                 music_path = resolve_path(self.base_dir, self.background_music_path)
                 if music_path.exists():
                     pygame.mixer.music.load(str(music_path))
@@ -741,10 +761,12 @@ class VisualLotteryWindow(tk.Toplevel):
         return names
 
     def _refresh_prize_options(self) -> None:
-        options = []
+        # 标签 -> 奖项映射，选择时直接查表，无需解析标签再线性查找
+        self._label_to_prize = {}
         for prize in self.prizes:
             remaining = remaining_slots(prize, self.state)
-            options.append(f"{prize.prize_id} - {prize.name} (剩余 {remaining})")
+            self._label_to_prize[f"{prize.prize_id} - {prize.name} (剩余 {remaining})"] = prize
+        options = list(self._label_to_prize)
         self.prize_combo["values"] = options
         current_label = self._format_prize_label(self.prize)
         if current_label in options:
@@ -762,8 +784,7 @@ class VisualLotteryWindow(tk.Toplevel):
         self._refresh_prize_options()
         label = self.prize_var.get().strip()
         if label:
-            prize_id = label.split(" - ", 1)[0]
-            self.prize = next((item for item in self.prizes if item.prize_id == prize_id), None)
+            self.prize = self._label_to_prize.get(label)
         if not self.prize and self.prizes:
             self.prize = self.prizes[0]
             self.prize_var.set(self._format_prize_label(self.prize))
@@ -778,8 +799,7 @@ class VisualLotteryWindow(tk.Toplevel):
         label = self.prize_var.get().strip()
         if not label:
             return
-        prize_id = label.split(" - ", 1)[0]
-        prize = next((item for item in self.prizes if item.prize_id == prize_id), None)
+        prize = self._label_to_prize.get(label)
         if prize:
             self.prize = prize
             self.state_mode = self.BOUNCE
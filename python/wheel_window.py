@@ -19,6 +19,7 @@ from typing import Any, Callable
 import pygame
 
 from lottery import resolve_path
+from wheel_window_colors import DEFAULT_WHEEL_COLORS
 from wheel_window_logic import WheelWindowLogic
 from wheel_window_particles import WheelWindowParticles
 from wheel_window_prize import WheelWindowPrize
@@ -27,31 +28,6 @@ from wheel_window_scroll import WheelWindowScroll
 from wheel_window_ui import WheelWindowUI
 
 
-DEFAULT_WHEEL_COLORS = {
-    "bg_canvas": "#4A0C0C",
-    "panel_bg": "#5C1010",
-    "panel_border": "#8B1A1A",
-    "gold": "#F7D774",
-    "gold_deep": "#D9A441",
-    "white": "#FFF8E7",
-    "red": "#E53935",
-    "red_deep": "#B71C1C",
-    "accent": "#FFD700",
-    "text_main": "#FFF8E7",
-    "text_muted": "#F6D9B8",
-    "title_fg": "#F7D774",
-    "status_fg": "#F7D774",
-    "history_bg": "#7A1616",
-    "history_fg": "#FFF8E7",
-    "winner_bg": "#7A1616",
-    "winner_fg": "#FFF8E7",
-    "combo_bg": "#7A1616",
-    "combo_border": "#8B1A1A",
-    "combo_fg": "#FFF8E7",
-    "combo_arrow": "#FFF8E7",
-}
-
-
 class WheelLotteryWindow(
     tk.Toplevel,
     WheelWindowUI,
@@ -71,7 +47,7 @@ class WheelLotteryWindow(
         people: list[Any],
         state: dict[str, Any],
         global_must_win: set[str],
-        excluded_ids: set[str] | list[Any],
+        excluded_ids: set[str] | frozenset[str] | list[Any],
         include_excluded: bool,
         excluded_winner_range: tuple[int | None, int | None] | None,
         wheel_single_round_display: bool,
@@ -90,10 +66,15 @@ class WheelLotteryWindow(
         self.root = root
         self.base_dir = base_dir
         self.prizes = prizes
+        self._prize_by_id = {prize.prize_id: prize for prize in prizes}
         self.people = people
         self.lottery_state = state 
         self.global_must_win = global_must_win
         self.excluded_ids = excluded_ids
+        # 排除名单统一成工号字符串集合，每次抽奖/预览直接复用，无需逐项重建
+        self.clean_excluded_ids = frozenset(
+            str(item.person_id) if hasattr(item, "person_id") else str(item) for item in excluded_ids
+        )
         self.include_excluded = include_excluded
         self.excluded_winner_range = excluded_winner_range
         self.on_transfer = on_transfer
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Default color theme for the wheel window."""
+
+from __future__ import annotations
+
+DEFAULT_WHEEL_COLORS = {
+    "bg_canvas": "#4A0C0C",
+    "panel_bg": "#5C1010",
+    "panel_border": "#8B1A1A",
+    "gold": "#F7D774",
+    "gold_deep": "#D9A441",
+    "white": "#FFF8E7",
+    "red": "#E53935",
+    "red_deep": "#B71C1C",
+    "accent": "#FFD700",
+    "text_main": "#FFF8E7",
+    "text_muted": "#F6D9B8",
+    "title_fg": "#F7D774",
+    "status_fg": "#F7D774",
+    "history_bg": "#7A1616",
+    "history_fg": "#FFF8E7",
+    "winner_bg": "#7A1616",
+    "winner_fg": "#FFF8E7",
+    "combo_bg": "#7A1616",
+    "combo_border": "#8B1A1A",
+    "combo_fg": "#FFF8E7",
+    "combo_arrow": "#FFF8E7",
+}
@@ -22,7 +22,7 @@ else:
     pyttsx3 = importlib.import_module("pyttsx3")
     TTS_AVAILABLE = True
 
-from lottery import draw_prize, remaining_slots
+from lottery import draw_prize, fork_state, remaining_slots
 
 
 class WheelWindowLogic:
@@ -216,23 +216,18 @@ class WheelWindowLogic:
                 messagebox.showinfo("提示", "当前奖项已无候选人")
                 return
         prize_id = prize_label.split(" - ", 1)[0]
-        prize = next((p for p in self.prizes if p.prize_id == prize_id), None)
+        prize = self._prize_by_id.get(prize_id)
         if not prize:
             messagebox.showinfo("提示", "当前奖项已无候选人")
             return
 
-        clean_excluded_ids = set()
-        for item in self.excluded_ids:
-            if hasattr(item, "person_id"):
-                clean_excluded_ids.add(str(item.person_id))
-            else:
-                clean_excluded_ids.add(str(item))
+        clean_excluded_ids = self.clean_excluded_ids
 
         remaining = remaining_slots(prize, self.lottery_state)
         if remaining <= 0:
             return
 
-        preview_state = copy.deepcopy(self.lottery_state)
+        preview_state = fork_state(self.lottery_state, prize.prize_id)
         # Bug2: 一次性抽完当前奖项剩余名额，进入自动连抽队列
         try:
             winners = draw_prize(
@@ -286,7 +281,7 @@ class WheelWindowLogic:
         label = self.prize_var.get().strip()
         if not label: return
         prize_id = label.split(" - ", 1)[0]
-        prize = next((p for p in self.prizes if p.prize_id == prize_id), None)
+        prize = self._prize_by_id.get(prize_id)
         if not prize: return
 
         prize_must_win_set = set(prize.must_win_ids)
@@ -294,12 +289,7 @@ class WheelWindowLogic:
         prize_state = self.lottery_state.get("prizes", {}).get(prize_id, {"winners": []})
         existing_prize_winners = {str(pid) for pid in prize_state.get("winners", [])}
         previous_winners_set = {str(w["person_id"]) for w in self.lottery_state["winners"]} if prize.exclude_previous_winners else set()
-        clean_excluded_ids = set()
-        for item in self.excluded_ids:
-            if hasattr(item, "person_id"):
-                clean_excluded_ids.add(str(item.person_id))
-            else:
-                clean_excluded_ids.add(str(item))
+        clean_excluded_ids = self.clean_excluded_ids
         exclude_excluded_list = prize.exclude_excluded_list and not self.include_excluded
 
         blacklist = excluded_must_win | previous_winners_set | existing_prize_winners
@@ -11,6 +11,7 @@ from lottery import remaining_slots
 class WheelWindowPrize:
     def update_prizes(self, prizes: list[Any], state: dict[str, Any]) -> None:
         self.prizes = prizes
+        self._prize_by_id = {prize.prize_id: prize for prize in prizes}
         self.lottery_state = state
         
         current_val = self.prize_var.get()
@@ -53,7 +54,7 @@ class WheelWindowPrize:
         if not label:
             return None
         prize_id = label.split(" - ", 1)[0]
-        return next((prize for prize in self.prizes if prize.prize_id == prize_id), None)
+        return self._prize_by_id.get(prize_id)
 
     def _current_prize_remaining(self) -> int:
         current_prize = self._get_current_prize()